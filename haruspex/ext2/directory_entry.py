@@ -2,6 +2,8 @@
 #  - nothing else for now.
 
 import struct
+from array import array
+from collections import namedtuple
 
 # Types of files recognized by Ext2
 file_types = {
@@ -14,10 +16,62 @@ file_types = {
     6: "Socket",
     7: "Symbolic link"
 }
+# the same, but indexed directly by the 'file_type' field (valid values are 0 to 7)
+_FILE_TYPES = tuple(file_types[i] for i in range(len(file_types)))
 
 # Filename encoding
 ENCODING = 'latin-1' # generally latin-1 is used
 
+# The constant part of a directory entry (inode, rec_len, name_len, file_type),
+# compiled once so that every entry is parsed with a single call.
+_HEADER = struct.Struct("<IHBB")
+
+# Template for DirectoryEntry.__str__ (used a lot when listing directories)
+_STR_TEMPLATE = (
+        "Inode number:           {}\n"
+        "Directory entry length: {}\n"
+        "Filename length:        {}\n"
+        "File type:              {}\n"
+        "Filename:               {}\n"
+    )
+
+# A lighter, read-only, representation of a directory entry (see DirectoryEntry.as_tuple).
+# Here 'file_type' is kept as the number (the key of 'file_types'), not the string.
+DirectoryEntryTuple = namedtuple("DirectoryEntryTuple", "inode rec_len name_len file_type name")
+
+
+def parse_block(buf):
+    """
+    Parses a whole directory block (buf) into columns instead of objects: it returns
+    a tuple of arrays (inodes, rec_lens, name_lens, file_types, name_offsets), where
+    the i-th position of each one corresponds to the i-th entry of the block.
+    (the name of that entry is buf[name_offsets[i]:name_offsets[i]+name_lens[i]])
+
+    This is handy for bulk listings and filters (e.g. all the regular files), since no
+    DirectoryEntry is created at all.
+    """
+    inodes       = array("I")
+    rec_lens     = array("H")
+    name_lens    = array("B")
+    file_types   = array("B")
+    name_offsets = array("I")
+    unpack = _HEADER.unpack_from
+    header_size = _HEADER.size
+    offset = 0
+    last = len(buf) - header_size
+    while offset <= last:
+        inode, rec_len, name_len, file_type = unpack(buf, offset)
+        if rec_len == 0:
+            break
+        inodes.append(inode)
+        rec_lens.append(rec_len)
+        name_lens.append(name_len)
+        file_types.append(file_type if file_type <= 7 else 0)
+        name_offsets.append(offset + header_size)
+        offset += rec_len
+    return inodes, rec_lens, name_lens, file_types, name_offsets
+
+
 class DirectoryEntry:
     """
     Class representing a Directory Entry of an ext2 filesystem.
@@ -30,41 +84,111 @@ class DirectoryEntry:
     are added for padding at the end of the filename, if necessary.
     (but the 'name_len' field stores the actual file name length)
     """
+    # There can be a lot of these (one per file in a directory), so we avoid the per-instance dict.
+    __slots__ = ("_inode", "_rec_len", "_name_len", "_file_type", "_name", "_name_str")
+
     def __init__(self, data=bytes(8),
                  inode=None, rec_len=None, name_len=None, file_type=None, name=None
                  ):
 
         # let's parse
-        p_inode     = struct.unpack("<I", data[0:4])[0]
-        p_rec_len   = struct.unpack("<H", data[4:6])[0]
-        p_name_len  = struct.unpack("<B", data[6:7])[0]
-        p_file_type = struct.unpack("<B", data[7:8])[0]
+        mv = memoryview(data) # so that slicing the name doesn't copy it
+        p_inode, p_rec_len, p_name_len, p_file_type = _HEADER.unpack_from(mv, 0)
         # I directly assign the raw binaries to it and then in the '__str__' I make it a 'decode'.
-        p_name      = data[8:8+p_name_len] # variable length
+        p_name      = mv[8:8+p_name_len] # variable length (a view, not a copy)
         # note: by default, the 'slice' will return b'' (empty bytestring) and not IndexError
+        # note 2: only data[0:8+name_len] is used, so 'data' can be the whole rec_len-sized
+        #         record; the null padding after the name is never touched (nor copied).
+
+        # and now we set the parsed values (they come from the struct, so they are already ints)
+        self._inode     = p_inode
+        self._rec_len   = p_rec_len
+        self._name_len  = p_name_len
+        self._file_type = p_file_type if p_file_type <= 7 else 0
+        self._name      = p_name
+        self._name_str  = None # decoded on demand (see 'name_str')
+        # and the parameterized ones (through the setters, to check them) where given.
+        # (we compare against None, otherwise a legitimate 0 or b'' would be ignored)
+        if inode is not None:
+            self.inode = inode
+        if rec_len is not None:
+            self.rec_len = rec_len
+        if name_len is not None:
+            self.name_len = name_len
+        if file_type is not None:
+            self.file_type = file_type
+        if name is not None:
+            self.name = name
+
+    @classmethod
+    def iter_block(cls, buf, deleted=True):
+        """
+        Generator that walks a whole directory block (buf), yielding a DirectoryEntry
+        for each record in it (deleted ones, with inode 0, included unless 'deleted'
+        is False, in which case they are skipped without building an object for them).
+
+        The entries are chained by their 'rec_len', so the block is parsed in a single
+        pass over one memoryview: the names are views of 'buf' (no copies), and the
+        parsed values are stored directly, without going through the setters.
+        (we jump from entry to entry with 'rec_len', so the padding after each name is skipped)
+        """
+        mv = memoryview(buf)
+        # everything used in the loop is bound to locals, to save the lookups per entry.
+        unpack = _HEADER.unpack_from
+        new = cls.__new__
+        header_size = _HEADER.size
+        offset = 0
+        last = len(mv) - header_size # last offset where a whole header still fits
+        while offset <= last:
+            inode, rec_len, name_len, file_type = unpack(mv, offset)
+            if rec_len == 0:
+                # a corrupted (or zeroed) entry would make us loop forever.
+                break
+            if inode == 0 and not deleted:
+                offset += rec_len
+                continue
+            entry = new(cls)
+            entry._inode     = inode
+            entry._rec_len   = rec_len
+            entry._name_len  = name_len
+            entry._file_type = file_type if file_type <= 7 else 0 # (it's unsigned, so no need to check < 0)
+            name_start = offset + header_size
+            entry._name      = mv[name_start:name_start+name_len]
+            entry._name_str  = None
+            yield entry
+            offset += rec_len
 
-        self._raw_data = data
-        # and now we set, either the parameterized values or the parsed ones
-        self.inode     = inode     or p_inode
-        self.rec_len   = rec_len   or p_rec_len
-        self.name_len  = name_len  or p_name_len
-        self.file_type = file_type or p_file_type
-        self.name      = name      or p_name
+    @staticmethod
+    def as_tuple(data):
+        """
+        Parses a directory entry (data) into a DirectoryEntryTuple, instead of a
+        DirectoryEntry object. Useful for read-only listings, since a tuple is smaller
+        and its fields are accessed without going through properties.
+        """
+        inode, rec_len, name_len, file_type = _HEADER.unpack_from(data, 0)
+        name = bytes(data[_HEADER.size:_HEADER.size+name_len])
+        return DirectoryEntryTuple(inode, rec_len, name_len, file_type if file_type <= 7 else 0, name)
 
     @property
     def raw_data(self):
         """
-        Bytes to be parsed.
+        Bytes of the directory entry (read-only).
         (are the [8 to n] bytes corresponding to the structure of a directory entry)
-        """
-        return self._raw_data
 
-    @raw_data.setter
-    def raw_data(self, value):
-        pass
+        They are not kept around after parsing, but rebuilt from the current fields,
+        with the name padded with nulls up to 'rec_len'.
+        """
+        name = bytes(self._name)
+        padding = bytes(max(0, self._rec_len - _HEADER.size - len(name)))
+        return _HEADER.pack(self._inode, self._rec_len, self._name_len, self._file_type) + name + padding
     
     # ---
 
+    # The setters check and coerce (int()) the values that come from the user.
+    # The parsed values don't need it (Struct.unpack_from already returns ints, and
+    # the file type is range checked there), so __init__ and iter_block store them
+    # directly in the private attributes.
+
     @property
     def inode(self):
         """
@@ -105,38 +229,48 @@ class DirectoryEntry:
         """
         Returns a string corresponding to the file type
         """
-        return file_types[self._file_type]
+        return _FILE_TYPES[self._file_type]
 
     @file_type.setter
     def file_type(self, value):
         value = int(value)
-        # to avoid a KeyError
-        if value < 0 or value > 7:
+        # to avoid an IndexError (a mask would turn invalid types into valid ones)
+        if not 0 <= value <= 7:
             value = 0
         self._file_type = value
 
     @property
     def name(self):
         """
-        Filename (up to 255 chars)
+        Filename (up to 255 chars), as a bytestring or a memoryview of the parsed data
         """
         return self._name
 
     @name.setter
     def name(self, value):
-        # I admit both strings and bytestrings, but internally I keep bytestrings.
+        # I admit strings, bytestrings and memoryviews, but internally I keep bytestrings
+        # or memoryviews (a view of the directory block is kept as is, to avoid a copy).
         if isinstance(value, str):
             value = bytes(value, ENCODING)
         self._name = value
+        self._name_str = None # the decoded name is no longer valid
+
+    @property
+    def name_str(self):
+        """
+        Filename decoded as a string (read-only).
+        It's decoded only the first time, and then kept until the name changes.
+        """
+        name_str = self._name_str
+        if name_str is None:
+            name_str = bytes(self._name).decode(ENCODING)
+            self._name_str = name_str
+        return name_str
 
     # ---
 
     def __str__(self):
-        return (
-                f"Inode number:           {self.inode}\n"
-                f"Directory entry length: {self.rec_len}\n"
-                f"Filename length:        {self.name_len}\n"
-                f"File type:              {self.file_type}\n"
-                f"Filename:               {self.name.decode(ENCODING)}\n"
+        return _STR_TEMPLATE.format(
+                self._inode, self._rec_len, self._name_len, _FILE_TYPES[self._file_type], self.name_str
             )
 
@@ -21,8 +21,15 @@ from . import directory_entry
 from . import group_descriptor
 from . import inode
 from . import superblock
+from ..utils import slicer
 
+import io
+import mmap
+import os
 import struct
+import sys
+from array import array
+from collections import OrderedDict
 from math import ceil
 
 # Constants representing sizes in bytes
@@ -38,9 +45,199 @@ GD_STRUCT_SIZE          = 32
 #   but I need the exact value to correctly read the inodes from the disk (I get this value from the superblock, see Ext2's constructor).
 DENTRY_STRUCT_BASE_SIZE = 8
 
+# Readahead window (hinted to the OS) when a file is read sequentially,
+# it starts at READAHEAD_MIN and doubles on each hint up to READAHEAD_MAX.
+READAHEAD_MIN = 128 * 1024
+READAHEAD_MAX = 2 * 1024 * 1024
+
+# Files up to this size are read whole when opened (see FileHandle)
+SMALL_FILE_SIZE = 1024 * 1024
+
+# Buffer size used when the handle we are given is unbuffered (see Ext2's constructor)
+HANDLE_BUFFER_SIZE = 64 * 1024
+
+# Maximum number of parsed indirect blocks kept in memory (see Ext2._parse_indirect_X_block)
+INDIRECT_CACHE_SIZE = 4096
+# Maximum number of inodes and of directory entries (name -> inode) kept in memory (see Ext2.open)
+INODE_CACHE_SIZE  = 8192
+DENTRY_CACHE_SIZE = 8192
+# Maximum number of directories (already opened) kept by their path (see Ext2.open)
+PATH_CACHE_SIZE   = 1024
+
+# Number of simple indirect blocks that are read together when going through a double indirect block
+INDIRECT_BATCH = 64
+
+# Access pattern hints for os.posix_fadvise (which doesn't exist on Windows, thus the None)
+_FADV_SEQUENTIAL = getattr(os, "POSIX_FADV_SEQUENTIAL", None)
+_FADV_WILLNEED   = getattr(os, "POSIX_FADV_WILLNEED", None)
+
+# A block pointer (for the few times that we need only one, see Ext2._follow_path)
+_POINTER = struct.Struct("<I")
+
 # Encoding of filenames and paths
 ENCODING = 'latin-1'
 
+# A note on parsing: the fixed-layout structures (superblock, group descriptor, inode, directory entry)
+# compile their formats once, as struct.Struct objects at module level (see directory_entry._HEADER or superblock._SB_STRUCT),
+# instead of passing format strings to struct.unpack on every call.
+# Arrays of block pointers don't go through struct at all, they are loaded in one go with _block_pointers.
+
+def _all_block_pointers(raw_block):
+    """
+    Returns all the block pointers contained in a (raw) indirect block (the null ones too),
+    as an array of unsigned ints (4 bytes each, instead of a list of Python ints).
+    The 4-byte pointers are loaded all at once in an array (instead of unpacking them one at a time).
+    """
+    pointers = array("I") # unsigned int, 4 bytes (on every platform we care about)
+    pointers.frombytes(raw_block)
+    if sys.byteorder == "big":
+        pointers.byteswap() # ext2 structures are stored in little endian
+    return pointers
+
+def _block_pointers(raw_block):
+    """
+    Returns the non-null (!= 0) block pointers contained in a (raw) indirect block,
+    as an array of unsigned ints (the null ones are filtered out with 'filter', at C speed).
+    """
+    return array("I", filter(None, _all_block_pointers(raw_block)))
+
+
+def _cache_get(cache, key):
+    """
+    Returns the value of 'key' in the OrderedDict 'cache' (one of the Ext2 caches), or None
+    if it's not there. A hit moves the entry to the end, so the caches are LRU: the entries
+    at the beginning are the least recently used ones (see _cache_put).
+    """
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+def _cache_put(cache, key, value, max_size):
+    """
+    Stores 'value' in 'cache' (one of the Ext2 caches), dropping the first entry (the least
+    recently used one, if the cache is an OrderedDict read through _cache_get) if it already
+    has 'max_size' of them. Returns 'value'.
+    """
+    if len(cache) >= max_size:
+        del cache[next(iter(cache))] # (dicts keep the insertion order, so this is the first one)
+    cache[key] = value
+    return value
+
+
+class _BlockMap:
+    """
+    Lazy sequence with the data block numbers of a file (see FileHandle).
+    The block numbers are taken from 'chunks' (an iterator of arrays, see
+    Ext2._iter_data_block_numbers) only as far as they are needed, so that opening
+    a big file doesn't go through all of its indirect blocks before reading a single byte.
+    As in _LogicalBlockMap, the position of each block number is its logical block number
+    in the file, and the holes of the file are there as 0's (see Ext2.read_blocks).
+
+    :param chunks: iterator of arrays with the block numbers (0 for a hole), in logical order
+    :param length: the number of data blocks of the file
+    """
+    __slots__ = ("_blocks", "_chunks", "_length")
+
+    def __init__(self, chunks, length):
+        self._blocks = array("I") # the block numbers loaded so far
+        self._chunks = chunks
+        self._length = length
+
+    def __len__(self):
+        return self._length
+
+    def _load(self, count):
+        """
+        Loads block numbers until there are at least 'count' of them (or there are no more).
+        """
+        blocks = self._blocks
+        while len(blocks) < count and self._chunks is not None:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._chunks = None # we went through all the indirect blocks
+                # (whatever is left, up to the size of the file, can only be a hole at its end)
+                if len(blocks) < self._length:
+                    blocks += array("I", bytes(4 * (self._length - len(blocks))))
+            else:
+                blocks += chunk
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            self._load(stop)
+            return self._blocks[start:stop:step]
+        if key < 0:
+            key += self._length
+        self._load(key + 1)
+        return self._blocks[key]
+
+
+class _LogicalBlockMap:
+    """
+    Sequence with the data block numbers of a file that has no holes (see FileHandle),
+    where the position of each block number is its logical block number in the file.
+    (a hole would still be a 0 in its place, like in _BlockMap, so nothing breaks if there is one)
+    Each one is found following its path in the pointers of the inode (see Ext2._block_to_path),
+    so only the simple indirect block that holds it is read (and kept, since the following
+    block numbers are there too), no matter how far it is from the beginning of the file.
+
+    :param filesystem: the base filesystem (of class Ext2) to which the file belongs
+    :param i_block: the 'i_block' pointers of the file's inode
+    :param length: the number of data blocks of the file
+    """
+    __slots__ = ("_filesystem", "_i_block", "_length", "_pointers_per_block", "_pages")
+
+    def __init__(self, filesystem, i_block, length):
+        self._filesystem = filesystem
+        self._i_block = i_block
+        self._length = length
+        self._pointers_per_block = filesystem.block_size // 4
+        self._pages = {} # the pointers of the simple indirect blocks already read, by their order in the file
+
+    def __len__(self):
+        return self._length
+
+    def _page(self, page, index):
+        """
+        Returns the pointers of the 'page'-th simple indirect block of the file (the one that holds 'index').
+        """
+        pointers = self._pages.get(page)
+        if pointers is None:
+            # we follow the path up to the simple indirect block (without its last step), and we read it whole.
+            # (if there's a null pointer on the way, we get 0 and read_blocks gives zeros: all of its blocks are holes)
+            path = self._filesystem._block_to_path(index)
+            indirect_1_block = self._filesystem._follow_path(self._i_block, path[:-1])
+            pointers = self._pages[page] = _all_block_pointers(self._filesystem.read_blocks((indirect_1_block,))[0])
+        return pointers
+
+    def _get(self, index):
+        if index < 12:
+            return self._i_block[index] # a direct pointer
+        page, offset = divmod(index - 12, self._pointers_per_block)
+        return self._page(page, index)[offset]
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            if step != 1:
+                return array("I", [self._get(i) for i in range(start, stop, step)])
+            # the usual case (see FileHandle.read): we copy whole pieces of each page.
+            ret = array("I", self._i_block[start:min(stop, 12)]) # (the direct ones)
+            start = max(start, 12)
+            while start < stop:
+                page, offset = divmod(start - 12, self._pointers_per_block)
+                end = min(stop, start + self._pointers_per_block - offset)
+                ret += self._page(page, start)[offset:offset + end - start]
+                start = end
+            return ret
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError("block index out of range")
+        return self._get(key)
+
+
 class Directory:
     """
     A directory is actually an inode whose data blocks that it points to,
@@ -58,14 +255,45 @@ class Directory:
         self.inode_obj = inode_obj
         self.name = name
 
-        self.files = []
+        self._files = None # the directory entries are parsed the first time they're needed (see 'files')
+        self._name_to_inode = None # and the same for the <name: inode> dictionary (see 'name_to_inode')
 
-        if parent is None:
-            self.path = self.name.decode(ENCODING) # for the root, 'name' will be the 'volume_name'.
-        else:
-            self.path = parent.path + '/' + self.name.decode(ENCODING)
+        # the path string is built only if it's asked for (see 'path'), going up through the parents.
+        self.parent = parent
+        self._path = None
 
-        self._parse()
+    @property
+    def files(self):
+        """
+        The list of directory entries (DirectoryEntry objects) of the directory,
+        parsed from its data blocks the first time it's asked for.
+        (so a Directory that we only go through in Ext2.open, doesn't read anything)
+        """
+        if self._files is None:
+            self._files = []
+            self._parse()
+        return self._files
+
+    @property
+    def name_to_inode(self):
+        """
+        Dictionary <name: inode number> built (once) from the directory entries of the directory.
+        """
+        if self._name_to_inode is None:
+            self._name_to_inode = {f.name:f.inode for f in self.files}
+        return self._name_to_inode
+
+    @property
+    def path(self):
+        """
+        The (absolute) path of the directory, built (once) from the names of its parents.
+        """
+        if self._path is None:
+            if self.parent is None:
+                self._path = self.name.decode(ENCODING) # for the root, 'name' will be the 'volume_name'.
+            else:
+                self._path = self.parent.path + '/' + self.name.decode(ENCODING)
+        return self._path
 
     def __repr__(self):
         # a bit of a hack (X or Y) in case we want to show the root directory,
@@ -76,33 +304,25 @@ class Directory:
         ret = f"< Directory {self.path or '/'} >\n"
         ret += "---------------------------------FILES------------------------------------\n"
         for f in self.files:
-            ret += f"{f.name.decode(ENCODING):50} ({f.file_type})\n"
+            ret += f"{f.name_str:50} ({f.file_type})\n"
         ret += "--------------------------------------------------------------------------\n"
         return ret
 
-    def _read_dentries(self, block_number):
+    def _read_dentries(self, raw_block):
         """
-        Internal method that reads and parses the directory entries of a block
-        in the filesystem. It adds DirectoryEntry objects to the list of files
+        Internal method that parses the directory entries of a (raw) block
+        of the filesystem. It adds DirectoryEntry objects to the list of files
         of the current Directory object.
         """
 
-        raw_block = self.filesystem.read_block(block_number)
-
-        offset = 0 # this variable will store the starting address of each directory entry
-        block_size = self.filesystem.superblock.s_log_block_size
-        # let's read and parse the directory entries (the last valid entry points to the end of the block)
-        while offset < block_size:
-            dx = offset + DENTRY_STRUCT_BASE_SIZE
-            file = directory_entry.DirectoryEntry(raw_block[offset:dx]) # we parse the first 8 bytes (the constant part of the dentry).
-            file.name = raw_block[dx:dx+file.name_len] # and now the rest, corresponding to the name (the variable part).
-            if file.inode != 0:
-                # This happens only if the first file is deleted;
-                # all other deleted file entries will be skipped due to
-                # a proper rec_len of the previous entry.
-                # (file deleted -> prev. rec_len points to next dentry, and inode=0)
-                self.files.append(file)
-            offset += file.rec_len
+        # let's read and parse the directory entries (the last valid entry points to the end of the block),
+        # DirectoryEntry.iter_block walks the whole block (len(raw_block)) following the rec_len of each entry.
+        # The entries with inode 0 are skipped (without parsing them into objects):
+        # this happens only if the first file is deleted;
+        # all other deleted file entries will be skipped due to
+        # a proper rec_len of the previous entry.
+        # (file deleted -> prev. rec_len points to next dentry, and inode=0)
+        self._files.extend(directory_entry.DirectoryEntry.iter_block(raw_block, deleted=False))
 
     def _parse(self):
         """
@@ -111,26 +331,23 @@ class Directory:
         data block assigned to the directory and parse the directory entries they contain.
         """
 
-        # let's read the direct blocks
-        direct_blocks = self.filesystem._parse_direct_blocks(self.inode_obj.i_block[0:12])
-        for directory_block_number in direct_blocks:
-            self._read_dentries(directory_block_number)
+        # let's get the numbers of the direct blocks
+        directory_block_numbers = self.filesystem._parse_direct_blocks(self.inode_obj.i_block[0:12])
 
-        # and now the indirect blocks
+        # and now the ones of the indirect blocks
         if self.inode_obj.i_block[12] != 0: # thus, we avoid reading the block '0' (*)
-            indirect_1_block = self.filesystem._parse_indirect_1_block(self.inode_obj.i_block[12])
-            for directory_block_number in indirect_1_block:
-                self._read_dentries(directory_block_number) # we read the directory entries contained in the blocks pointed to by the pointers of indirect_1_block.
+            directory_block_numbers += self.filesystem._parse_indirect_1_block(self.inode_obj.i_block[12])
 
         if self.inode_obj.i_block[13] != 0:
-            indirect_2_block = self.filesystem._parse_indirect_2_block(self.inode_obj.i_block[13])
-            for directory_block_number in indirect_2_block:
-                self._read_dentries(directory_block_number)
+            directory_block_numbers += self.filesystem._parse_indirect_2_block(self.inode_obj.i_block[13])
 
         if self.inode_obj.i_block[14] != 0:
-            indirect_3_block = self.filesystem._parse_indirect_3_block(self.inode_obj.i_block[14])
-            for directory_block_number in indirect_3_block:
-                self._read_dentries(directory_block_number)
+            directory_block_numbers += self.filesystem._parse_indirect_3_block(self.inode_obj.i_block[14])
+
+        # we read all the directory blocks at once (the consecutive ones with a single read),
+        # and then we parse the directory entries contained in them.
+        for raw_block in self.filesystem.read_blocks(directory_block_numbers):
+            self._read_dentries(raw_block)
 
 
         # *: Since a pointer pointing to block 0, means null pointer.
@@ -193,18 +410,44 @@ class FileHandle:
         self.inode_obj = inode_obj
         self.name = name
 
-        if parent is None:
-            self.path = self.name.decode(ENCODING) # for the root, 'name' will be the 'volume_name'.
-        else:
-            self.path = parent.path + '/' + self.name.decode(ENCODING)
+        # the path string is built only if it's asked for (see 'path'), going up through the parents.
+        self.parent = parent
+        self._path = None
 
         self.closed = False # I should put this attribute as 'private' through properties.
 
-        # We will always keep the file's bytes in a 'buffer',
+        # We keep all the block numbers that are assigned to the file, which makes the 'read' method much easier.
+        # They are loaded as 'read' and 'seek' need them (see _BlockMap), and not all of them in advance:
+        # for a big file that would mean going through all of its indirect blocks just to open it.
+        # (remember that each block is referenced by a 4-byte pointer, so 4*len(array) could be very large,
+        # that's why we keep them in an array of 4-byte unsigned ints and not in a list of Python ints)
+        # (here we can see different maximum sizes in blocks of a file: https://www.nongnu.org/ext2-doc/ext2.html#def-blocks)
+        # In both maps the n-th block number is the one of the file's n-th logical block (0 for a hole, that reads as zeros).
+        # If the file has no holes, we can go straight to any of them (see _LogicalBlockMap).
+        # Otherwise, we go through the pointers in order, as far as they are needed (see _BlockMap).
+        block_count = ceil(self.inode_obj.i_size / self.filesystem.block_size)
+        if self.filesystem._without_holes(self.inode_obj, block_count):
+            self._data_block_numbers = _LogicalBlockMap(self.filesystem, self.inode_obj.i_block, block_count)
+        else:
+            self._data_block_numbers = _BlockMap(self.filesystem._iter_data_block_numbers(self.inode_obj.i_block), block_count)
+        # the 'end of file' is defined by the length of this map (the last position would be its last data block).
+
+        # Small files (up to SMALL_FILE_SIZE bytes) are read whole right away, with all their blocks
+        # at once (see Ext2.read_blocks), so that 'read' and 'seek' only have to slice them and move the file pointer.
+        # (we join all its logical blocks, holes included: they read as zeros, so everything stays at its offset)
+        self._whole = None
+        if self.inode_obj.i_size <= SMALL_FILE_SIZE:
+            logical_blocks = self._data_block_numbers[0:len(self._data_block_numbers)] # (a single slice, as an array)
+            self._whole = b"".join(self.filesystem.read_blocks(logical_blocks))[:self.inode_obj.i_size]
+
+        # For the rest, we will always keep the file's bytes in a 'buffer',
         # one block at a time (starting with its first block)
-        self._buffer      = self.filesystem.read_block(self.inode_obj.i_block[0])
+        # (it's a memoryview, so that taking pieces of it in 'read' doesn't copy them)
+        self._buffer      = None
+        if self._whole is None:
+            self._buffer  = self.filesystem.read_blocks(self.inode_obj.i_block[0:1])[0] # (zeros if it's a hole, see read_blocks)
         self._buffer_pos  = 0 # 0 <= pos < buffer_size
-        self._buffer_size = self.filesystem.superblock.s_log_block_size
+        self._buffer_size = self.filesystem.block_size
 
         # We keep the pointer to the last 'buffered' block (block number relative to the file),
         # so that in the next reading of the file, we know where we are.
@@ -215,19 +458,24 @@ class FileHandle:
         # position in the file (pointer to the byte number), .tell() returns this
         self._file_pos = 0 # 0 <= pos < self.inode_obj.i_size
 
-        # We obtain in advance all the block numbers that are assigned to the file
-        # (I don't think it is the most efficient in terms of memory, but it makes the 'read' method much easier)
-        # (remember that each block is referenced by a 4-byte pointer, so 4*len(list) could be very large)
-        # (here we can see different maximum sizes in blocks of a file: https://www.nongnu.org/ext2-doc/ext2.html#def-blocks)
-        self._data_block_numbers = []
-        self._data_block_numbers = self.filesystem._parse_direct_blocks(self.inode_obj.i_block[0:12])
-        if self.inode_obj.i_block[12] != 0: # thus, we avoid reading the block '0' (just like in the class Directory)
-            self._data_block_numbers += self.filesystem._parse_indirect_1_block(self.inode_obj.i_block[12])
-        if self.inode_obj.i_block[13] != 0:
-            self._data_block_numbers += self.filesystem._parse_indirect_2_block(self.inode_obj.i_block[13])
-        if self.inode_obj.i_block[14] != 0:
-            self._data_block_numbers += self.filesystem._parse_indirect_3_block(self.inode_obj.i_block[14])
-        # the 'end of file' is defined by the length of this list (the last position would be its last data block).
+        # We let the OS know that the file will (most probably) be read sequentially,
+        # and then, as we see consecutive reads, we hint it the blocks that come next.
+        self._seq_reads = 0 # number of reads in a row that moved on to the next blocks
+        self._readahead_size = READAHEAD_MIN
+        if self._data_block_numbers and self._data_block_numbers[0] != 0:
+            self.filesystem._advise(self._data_block_numbers[0], len(self._data_block_numbers), _FADV_SEQUENTIAL)
+
+    @property
+    def path(self):
+        """
+        The (absolute) path of the file, built (once) from the names of its parents.
+        """
+        if self._path is None:
+            if self.parent is None:
+                self._path = self.name.decode(ENCODING) # for the root, 'name' will be the 'volume_name'.
+            else:
+                self._path = self.parent.path + '/' + self.name.decode(ENCODING)
+        return self._path
 
     def __repr__(self):
         return f"< FileHandle for {self.path} >"
@@ -259,23 +507,54 @@ class FileHandle:
         if size < 0: # it would indicate that we want to read the remaining bytes of the file.
             size = self.inode_obj.i_size - self._file_pos # file length in bytes - current position of the file pointer.
 
-        ret = [] # here we will store the byte strings that we read from the buffer, and in the end we will join everything.
+        if self._whole is not None: # the file was already read whole (it's small)
+            ret = self._whole[self._file_pos:self._file_pos+size]
+            self._file_pos += len(ret)
+            return ret
 
-        # while it is necessary to read a next block of the file to satisfy the reading, and we are not already in its last block (end of file)...
-        while size > (self._buffer_size - self._buffer_pos) and self._current_block_pointer+1 < len(self._data_block_numbers): # len is O(1)
-            ret.append(self._buffer[self._buffer_pos:]) # here we start from 'buffer_pos' in case it was read a little first (and we did not enter this 'while'), and then a lot (and we did enter).
-            size           -= self._buffer_size - self._buffer_pos # we are subtracting from 'size' the number of bytes that we already read.
-            self._file_pos += self._buffer_size - self._buffer_pos # we advance the file pointer as we read.
-            self._buffer_pos = 0 # as we consume the entire buffer, we set its position to 0.
+        ret = [] # here we will store the pieces (views) that we read from the buffer, and in the end we will join everything.
+        # (since the pieces are views, the join is the only copy of the bytes, into a result of the right size)
+
+        # If the reading goes beyond the buffer, we read all the following blocks we need at once
+        # (the consecutive ones with a single read, see Ext2.read_blocks), instead of one at a time.
+        needed = ceil((size - (self._buffer_size - self._buffer_pos)) / self._buffer_size)
+        if needed > 0:
             next_block_pointer = self._current_block_pointer + 1
-            next_block_number = self._data_block_numbers[next_block_pointer]
-            self._buffer = self.filesystem.read_block(next_block_number) # we read the next data block and load it into the buffer.
-            self._current_block_pointer = next_block_pointer
-
-        span = min(self.inode_obj.i_size - self._file_pos, size) # We do this to avoid reading more bytes from the buffer than the remaining bytes of the file.
-        ret.append(self._buffer[self._buffer_pos:self._buffer_pos+span]) # we read the X ('span') bytes from the buffer
-        self._buffer_pos += span # and we move the pointers of both the buffer and the file.
-        self._file_pos   += span # (there will be no overflow problems because 'span' will always be smaller than the block size)
+            next_blocks = iter(self.filesystem.read_blocks(self._data_block_numbers[next_block_pointer:next_block_pointer+needed]))
+
+        # (the loop works on local copies of the attributes, which are cheaper to access, and they are stored back after it)
+        buffer_size = self._buffer_size
+        buffer_pos = self._buffer_pos
+        buffer = self._buffer
+        file_pos = self._file_pos
+        block_pointer = self._current_block_pointer
+        last_block_pointer = len(self._data_block_numbers) - 1 # len is O(1)
+
+        # while it is necessary to read a next block of the file to satisfy the reading, and we are not already in its last block (end of file)...
+        while size > (buffer_size - buffer_pos) and block_pointer < last_block_pointer:
+            ret.append(buffer[buffer_pos:]) # here we start from 'buffer_pos' in case it was read a little first (and we did not enter this 'while'), and then a lot (and we did enter).
+            size     -= buffer_size - buffer_pos # we are subtracting from 'size' the number of bytes that we already read.
+            file_pos += buffer_size - buffer_pos # we advance the file pointer as we read.
+            buffer_pos = 0 # as we consume the entire buffer, we set its position to 0.
+            buffer = next(next_blocks) # we load the next data block (already read) into the buffer.
+            block_pointer += 1
+
+        span = min(self.inode_obj.i_size - file_pos, size) # We do this to avoid reading more bytes from the buffer than the remaining bytes of the file.
+        last_piece = buffer[buffer_pos:buffer_pos+span] # we read the X ('span') bytes from the buffer
+        self._buffer_pos = buffer_pos + span # and we move the pointers of both the buffer and the file.
+        self._file_pos   = file_pos + span   # (there will be no overflow problems because 'span' will always be smaller than the block size)
+        self._buffer = buffer
+        self._current_block_pointer = block_pointer
+
+        if needed > 0:
+            # after two reads in a row going through the following blocks, we hint the readahead.
+            self._seq_reads += 1
+            if self._seq_reads >= 2:
+                self._readahead()
+
+        if not ret:
+            return bytes(last_piece) # the reading didn't leave the buffer, so there's nothing to join.
+        ret.append(last_piece)
         return b"".join(ret)
 
             # I have to check what to do if trying to read more bytes than the file has. DONE
@@ -293,6 +572,28 @@ class FileHandle:
             # that it goes into the while, because there, an extra append would be made with what was left in the buffer. DONE
             # (It would not enter the while because the second condition would give 'false'; we will have stayed in the position of its last block).
 
+    def _readahead(self):
+        """
+        Internal method that hints the OS to read in advance the blocks that follow
+        the current one (as many as fit in the readahead window, which grows each time).
+        """
+        next_block_pointer = self._current_block_pointer + 1
+        remaining = len(self._data_block_numbers) - next_block_pointer
+        if remaining <= 0:
+            return
+        count = min(max(1, self._readahead_size // self._buffer_size), remaining)
+        # the hint covers a contiguous range on the disk, so we cut it at the end of the run
+        # of consecutive blocks that starts at the next one (usually the runs are long, so it's cheap).
+        block_numbers = self._data_block_numbers[next_block_pointer:next_block_pointer+count] # (a single slice, not one index at a time)
+        first = block_numbers[0]
+        if first == 0: # a hole, there's nothing to read in advance (at least for now)
+            return
+        run = 1
+        while run < count and block_numbers[run] == first + run:
+            run += 1
+        self.filesystem._advise(first, run, _FADV_WILLNEED)
+        self._readahead_size = min(self._readahead_size * 2, READAHEAD_MAX)
+
     def seek(self, offset, whence=0):
         """
         Moves the file pointer, based on 'offset'.
@@ -314,37 +615,44 @@ class FileHandle:
         else:
             raise ValueError(f"invalid whence ({whence}, should be 0, 1 or 2)")
 
+        if self._whole is not None: # the file was already read whole, so we only move the file pointer
+            self._file_pos = min(max(new_file_pos, 0), self.inode_obj.i_size)
+            return self._file_pos
+
         # The idea is to calculate the number of blocks that the new ABSOLUTE position
         # of the file pointer represents (always starting the count from the beginning of the file).
         # As we have previously loaded each data block number of the file (self._data_block_numbers),
         # we can directly obtain the block where the new position falls, and thus load it into the buffer.
 
         if new_file_pos >= self.inode_obj.i_size:       # If we want to go beyond the end of the file
-            block_number = self._data_block_numbers[-1] # we will keep its last block
+            block_index = len(self._data_block_numbers) - 1 # we will keep its last block
             self._buffer_pos = self._buffer_size        # and move the buffer pointer to the end of the buffer
             self._file_pos = self.inode_obj.i_size      # and the file pointer at the end of the file.
-            self._current_block_pointer = len(self._data_block_numbers) - 1 # We update this attribute for a future 'read()'.
         elif new_file_pos < 0:
-            block_number = self._data_block_numbers[0] # A similar analysis if we want to go further back of the beginning of the file..
+            block_index = 0 # A similar analysis if we want to go further back of the beginning of the file..
             self._buffer_pos = 0
             self._file_pos = 0
-            self._current_block_pointer = 0
         else:
-            block_index = new_file_pos // self._buffer_size       # Else, we get how many blocks of the file the offset covers,
-            block_number = self._data_block_numbers[block_index]  # we keep the data block number obtained from the calculated quantity
-            self._buffer_pos = new_file_pos % self._buffer_size   # we move the buffer pointer the remaining amount of bytes
-            self._file_pos = new_file_pos                         # and the file pointer should be the offset.
-            self._current_block_pointer = block_index             # We update this attribute for a future 'read()'.
-        
-        self._buffer = self.filesystem.read_block(block_number) # Finally we update the buffer with the reading of the obtained block.
+            # Else, we get how many blocks of the file the offset covers, and we move the buffer pointer the remaining amount of bytes
+            block_index, self._buffer_pos = divmod(new_file_pos, self._buffer_size)
+            self._file_pos = new_file_pos # and the file pointer should be the offset.
+
+        # If the new position falls in the block that is already in the buffer, there is nothing to read.
+        # (this is common when reading short records here and there, within the same block)
+        if block_index != self._current_block_pointer:
+            self._current_block_pointer = block_index # We update this attribute for a future 'read()'.
+            block_number = self._data_block_numbers[block_index] # we keep the data block number obtained from the calculated quantity
+            self._buffer = self.filesystem.read_blocks((block_number,))[0] # Finally we update the buffer with the reading of the obtained block (zeros for a hole).
+
+            # a seek to another block breaks the sequential reading, so the readahead starts over.
+            self._seq_reads = 0
+            self._readahead_size = READAHEAD_MIN
         
         return self._file_pos
 
-        # NOTA: I assume that in the list of data_block_numbers there would be no 'gaps' (0's) in between.
-        #       I don't know if it's possible *, but if it happens, this would fail
-        #       since data_block_numbers[block_index] would be out of date.
-        #       (* that is, I don't know if it is possible for a data block, to be deallocated from the file,
-        #       leaving a pointer to null (->0) in between, and then the inode pointers are not 'defragmented', or not 'compact')
+        # NOTE: data_block_numbers can have 'gaps' (0's) in between: those are the holes of a sparse file
+        #       (blocks that were never written). They are kept in their place, so block_index is always
+        #       the right logical block, and reading them gives zeros (see Ext2.read_blocks).
 
     def tell(self):
         """
@@ -385,18 +693,63 @@ class Ext2:
         self.handle = handle # for security, I should set this attribute as private through properties
         self.base_address = base_address
 
+        # if the handle is unbuffered (e.g. open(..., 'rb', buffering=0)), every read goes straight to the
+        # device, even the small ones (see read_record), so we put a buffer in between.
+        # (the buffer size is a multiple of 512, so the reads it does on the device stay aligned)
+        if isinstance(self.handle, io.RawIOBase):
+            self.handle = io.BufferedReader(self.handle, buffer_size=HANDLE_BUFFER_SIZE)
+
+        # the file descriptor of the handle (if it has one), to give hints to the OS (see '_advise')
+        try:
+            self._fileno = self.handle.fileno()
+        except (AttributeError, OSError): # (io.UnsupportedOperation is an OSError)
+            self._fileno = None
+
+        # the pointers of the indirect blocks already parsed, by (level, block number), see '_cached_indirect'.
+        # (it never has to be invalidated, since we don't write to the filesystem, and it's LRU, see '_cache_get')
+        self._indirect_cache = OrderedDict()
+        # the same for the inodes already read, by inode number (see '_get_inode'),
+        # and for the names already found in a directory, by (directory inode number, name) -> inode number (see 'open').
+        # (LRU too, so the ones that every path goes through, like the root's, stay there)
+        self._inode_cache = OrderedDict()
+        self._dentry_cache = OrderedDict()
+        # and the Directory objects already opened (with their inode numbers), by path (see 'open').
+        self._path_cache = OrderedDict()
+
+        # with a file descriptor, the runs of blocks can be read with os.pread (see read_blocks),
+        # a single syscall that doesn't depend on (nor move) the handle's position. (there's no os.pread on Windows)
+        self._pread = os.pread if (self._fileno is not None and hasattr(os, "pread")) else None
+
+        # if the handle is a regular file (e.g. a disk image), we map it in memory and read the blocks
+        # from there, without a seek+read (2 syscalls) for each one. With a device (like '\\.\PhysicalDrive0'
+        # or '/dev/sdb') the mapping fails, and we go on reading through the handle as always.
+        self._mm = None
+        self._mm_view = None
+        if self._fileno is not None:
+            try:
+                self._mm = mmap.mmap(self._fileno, 0, access=mmap.ACCESS_READ)
+                self._mm_view = memoryview(self._mm)
+            except (OSError, ValueError): # (ValueError: it's an empty file)
+                self._mm = None
+
         self.handle.seek(self.base_address)
 
         # the first 2 sectors of the partition correspond to the boot area (are unused by the ext2 filesystem).
         self.boot_area = self.handle.read(DISK_SECTOR_SIZE*2)
         # the next 1024 bytes correspond to the original superblock (we are already within block group 0).
-        self.superblock = superblock.Superblock(self.handle.read(SB_STRUCT_SIZE))
+        # (if they don't have the ext2 magic signature, we stop right here, instead of reading garbage as group descriptors)
+        self.superblock = superblock.Superblock(self.handle.read(SB_STRUCT_SIZE), validate=True)
+        # the block size (in bytes) is used in every read, so we keep it at hand as a plain int.
+        self.block_size = self.superblock.s_log_block_size
+        # what the holes of a file read as (see read_blocks)
+        self._zero_block = memoryview(bytes(self.block_size))
         # and then there will be as many group descriptors as there are block groups in the filesystem.
         # (the group descriptor table begins at the block following the superblock)
-        self.handle.seek(self.base_address + self.superblock.s_log_block_size * (self.superblock.s_first_data_block + 1))
+        self.handle.seek(self.base_address + self.block_size * (self.superblock.s_first_data_block + 1))
         useful_blocks = self.superblock.s_blocks_count - self.superblock.s_first_data_block # if block_size=1K, the first block doesn't belong to the first block_group
         block_group_count = ceil(useful_blocks / self.superblock.s_blocks_per_group) # (*1)
-        self.group_descriptors = [group_descriptor.GroupDescriptor(self.handle.read(GD_STRUCT_SIZE)) for i in range(block_group_count)] # (*2)
+        raw_gdt = self.handle.read(block_group_count * GD_STRUCT_SIZE) # we read the whole table at once,
+        self.group_descriptors = [group_descriptor.GroupDescriptor(raw_gd) for raw_gd in slicer(raw_gdt, GD_STRUCT_SIZE)] # and then we split it (*2)
 
         # we get the inode size, since it is not always 128 bytes.
         self.INODE_STRUCT_SIZE = self.superblock.s_inode_size
@@ -442,13 +795,16 @@ class Ext2:
         Method that reads a certain amount of bytes (length) from a given block
         of the filesystem (block_number), starting from an offset (by default 0).
         """
-        block_size = self.superblock.s_log_block_size
+        block_size = self.block_size
         address = block_number*block_size             # This number will be multiple of 512 as 'block_size' is.
-        self.handle.seek(self.base_address + address) # 'base_address' is also multiple, since it must be the sector of the device where the partition begins.
-        for i in range(offset//block_size):           # I do this mostly for very large offset cases*
-            self.handle.seek(block_size, 1)
+        if self._mm is not None: # (see Ext2's constructor) no alignment issues here, it's a regular file.
+            start = self.base_address + address + offset
+            return self._mm[start:start+length]
+        aligned_offset = offset - offset % DISK_SECTOR_SIZE # the part of the offset that is a multiple of 512,
+        self.handle.seek(self.base_address + address + aligned_offset) # so we can go there with a single seek (no matter how large the offset is).
+        # 'base_address' is also multiple, since it must be the sector of the device where the partition begins.
         # here I have to do a 'read' to move the device's pointer, because if I did a seek, the next read could give an error for just not being positioned in a multiple of 512.
-        self.handle.read(offset % block_size)         # *and then this read is small: it will be less than the block size (<= block_size-1),
+        self.handle.read(offset - aligned_offset)     # and then this read is small: it will be less than a sector (<= 511 bytes),
         raw_record = self.handle.read(length)
         return raw_record
 
@@ -469,8 +825,11 @@ class Ext2:
         """
         Method that reads a block from the filesystem (block_number >= 0).
         """
-        block_size = self.superblock.s_log_block_size
+        block_size = self.block_size
         address = block_number*block_size
+        if self._mm is not None: # (see Ext2's constructor)
+            start = self.base_address + address
+            return self._mm[start:start+block_size] # (slicing the mmap gives bytes, like a read would)
         self.handle.seek(self.base_address + address) # here everything goes well, because it is guaranteed that we will be in a multiple of 512 bytes.
         raw_block = self.handle.read(block_size) # therefore this read does not give problems.
         return raw_block
@@ -482,6 +841,53 @@ class Ext2:
         #raw_block = self.handle.read(block_size)
         #return raw_block
 
+    def read_blocks(self, block_numbers):
+        """
+        Method that reads several blocks from the filesystem, returning a list with
+        them (as memoryviews), in the same order as in 'block_numbers'.
+        Each run of consecutive block numbers is read with a single seek+read,
+        instead of one per block.
+        A block number 0 is a null pointer (a hole in a file), and it gives a block of zeros.
+        """
+        block_size = self.block_size
+        blocks = []
+        count = len(block_numbers)
+        i = 0
+        while i < count:
+            if block_numbers[i] == 0: # a hole, there's nothing to read (and block 0 is never a data block)
+                blocks.append(self._zero_block)
+                i += 1
+                continue
+            # we look for the end of the run that starts at block_numbers[i]
+            j = i + 1
+            while j < count and block_numbers[j] == block_numbers[j-1] + 1:
+                j += 1
+            start = self.base_address + block_numbers[i]*block_size # always a multiple of 512 (as in read_block)
+            if self._mm_view is not None: # (see Ext2's constructor) the views point into the mapping, nothing is copied.
+                raw_run = self._mm_view[start:start+(j - i)*block_size]
+            elif self._pread is not None:
+                raw_run = memoryview(self._pread(self._fileno, (j - i)*block_size, start))
+            else:
+                self.handle.seek(start)
+                raw_run = memoryview(self.handle.read((j - i)*block_size))
+            blocks.extend(raw_run[k*block_size:(k+1)*block_size] for k in range(j - i))
+            i = j
+        return blocks
+
+    def _advise(self, block_number, block_count, advice):
+        """
+        Internal method that hints the OS about how we will access 'block_count' blocks
+        of the filesystem, starting at 'block_number' (see os.posix_fadvise).
+        It does nothing if it's not possible (Windows, or a handle without a file descriptor).
+        """
+        if self._fileno is None or advice is None:
+            return
+        block_size = self.block_size
+        try:
+            os.posix_fadvise(self._fileno, self.base_address + block_number*block_size, block_count*block_size, advice)
+        except OSError:
+            pass # it's only a hint, so it's not a problem if it fails (e.g. on a pipe)
+
     def read_inode(self, inode_number):
         """
         Method that reads an inode from the filesystem (inode_number >= 1).
@@ -492,22 +898,32 @@ class Ext2:
         if inode_number < 1:
             raise TypeError("the inode number must be >= 1 !")
         # locating the inode
-        block_group = (inode_number - 1) // self.superblock.s_inodes_per_group
+        block_group, local_inode_index = divmod(inode_number - 1, self.superblock.s_inodes_per_group)
         first_inode_table_block = self.group_descriptors[block_group].bg_inode_table
-        local_inode_index = (inode_number - 1) % self.superblock.s_inodes_per_group
         # and now we read it
         raw_inode = self.read_record(first_inode_table_block, self.INODE_STRUCT_SIZE, offset=local_inode_index*self.INODE_STRUCT_SIZE)
         return raw_inode
 
+    def _get_inode(self, inode_number):
+        """
+        Internal method that returns the (parsed) Inode object of a given inode number,
+        reading it only if it wasn't read before (see '_inode_cache').
+        """
+        inode_obj = _cache_get(self._inode_cache, inode_number)
+        if inode_obj is None:
+            inode_obj = _cache_put(self._inode_cache, inode_number, inode.Inode(self.read_inode(inode_number)), INODE_CACHE_SIZE)
+        return inode_obj
+
     def _parse_direct_blocks(self, pointers):
         """
         Method that parses a list of direct pointers to data blocks.
         We already have the number of each data block, but what I do is filter
         the pointers to null blocks (p-> 0).
         """
-        data_block_numbers = [pointer for pointer in pointers if pointer != 0]
+        data_block_numbers = array("I", filter(None, pointers)) # (filter(None, ...) drops the 0's at C speed, no intermediate list)
         return data_block_numbers
         # There may be unallocated blocks yet (pointers to 0), so we will only keep those pointers that do not equal to null (0).
+        # (it's an array, just like what the _parse_indirect_X_block methods return, so they can be concatenated)
 
     def _parse_indirect_1_block(self, block_number):
         """
@@ -515,8 +931,10 @@ class Ext2:
         given its block number within the filesystem. By containing direct pointers,
         we directly obtain all the numbers of data block that indirectly points.
         """
-        raw_indirect_1_block = self.read_block(block_number)
-        indirect_1_block = [pointer[0] for pointer in struct.iter_unpack("<I", raw_indirect_1_block) if pointer[0] != 0]
+        indirect_1_block = _cache_get(self._indirect_cache, (1, block_number))
+        if indirect_1_block is None:
+            raw_indirect_1_block = self.read_block(block_number)
+            indirect_1_block = self._cached_indirect(1, block_number, _block_pointers(raw_indirect_1_block))
         return indirect_1_block
         # Each pointer occupies 4 bytes, therefore each indirect block will have block_size/4 pointers to other blocks.
 
@@ -528,16 +946,37 @@ class Ext2:
         method for each of them, and thus obtain all the data block numbers
         that are pointed at the end of this indirection chain.
         """
-        raw_indirect_2_block = self.read_block(block_number)
-        indirect_2_block = [pointer[0] for pointer in struct.iter_unpack("<I", raw_indirect_2_block) if pointer[0] != 0]
-        
-        data_block_numbers = []
+        data_block_numbers = _cache_get(self._indirect_cache, (2, block_number))
+        if data_block_numbers is None:
+            raw_indirect_2_block = self.read_block(block_number)
+            data_block_numbers = self._cached_indirect(2, block_number, self._parse_indirect_2_pointers(_block_pointers(raw_indirect_2_block)))
+        return data_block_numbers
 
-        for p in indirect_2_block:
-            data_block_numbers += self._parse_indirect_1_block(p)
+    def _parse_indirect_2_pointers(self, indirect_2_block):
+        """
+        Internal method that does the work of '_parse_indirect_2_block', given the
+        pointers (to simple indirect blocks) already read from the double indirect block.
+        """
+        data_block_numbers = array("I")
+
+        for indirect_1_block in self._iter_indirect_2_pointers(indirect_2_block):
+            data_block_numbers += indirect_1_block
 
         return data_block_numbers
 
+    def _iter_indirect_2_pointers(self, indirect_2_block, holes=False):
+        """
+        Internal generator that yields the pointers of each simple indirect block
+        pointed by 'indirect_2_block' (the pointers already read from a double indirect block).
+        With 'holes', the null pointers are kept (and a null simple indirect block gives a whole block of them).
+        """
+        pointers = _all_block_pointers if holes else _block_pointers
+        # all the simple indirect blocks are known at this point, so we read them together, INDIRECT_BATCH
+        # at a time (the consecutive ones with a single read, see 'read_blocks') instead of one at a time.
+        for i in range(0, len(indirect_2_block), INDIRECT_BATCH):
+            for raw_indirect_1_block in self.read_blocks(indirect_2_block[i:i+INDIRECT_BATCH]):
+                yield pointers(raw_indirect_1_block)
+
     def _parse_indirect_3_block(self, block_number):
         """
         Method that parses the pointers contained in a triple indirect block,
@@ -546,16 +985,110 @@ class Ext2:
         method for each of them, and thus obtain all the data block numbers
         that are pointed at the end of this indirection chain.
         """
+        data_block_numbers = _cache_get(self._indirect_cache, (3, block_number))
+        if data_block_numbers is not None:
+            return data_block_numbers
+
         raw_indirect_3_block = self.read_block(block_number)
-        indirect_3_block = [pointer[0] for pointer in struct.iter_unpack("<I", raw_indirect_3_block) if pointer[0] != 0]
-        # how much power in a single line of code! it's beautiful, Python at its best!
+        indirect_3_block = _block_pointers(raw_indirect_3_block)
 
-        data_block_numbers = []
+        data_block_numbers = array("I")
 
-        for p in indirect_3_block:
-            data_block_numbers += self._parse_indirect_2_block(p)
+        # same as before, the double indirect blocks are read together, but not the whole tree at once
+        # (it could be block_size/4 times larger, so we go one double indirect block at a time).
+        for raw_indirect_2_block in self.read_blocks(indirect_3_block):
+            data_block_numbers += self._parse_indirect_2_pointers(_block_pointers(raw_indirect_2_block))
 
-        return data_block_numbers
+        return self._cached_indirect(3, block_number, data_block_numbers)
+
+    def _cached_indirect(self, level, block_number, data_block_numbers):
+        """
+        Internal method that keeps the block numbers obtained from an indirect block
+        (of the given level), so that it doesn't have to be read and parsed again
+        (e.g. a big directory, which is parsed each time a path goes through it).
+        The least recently used entry is dropped once there are INDIRECT_CACHE_SIZE of them.
+        Returns 'data_block_numbers'.
+        """
+        return _cache_put(self._indirect_cache, (level, block_number), data_block_numbers, INDIRECT_CACHE_SIZE)
+
+    def _block_to_path(self, logical_block):
+        """
+        Internal method that returns the path to a logical block of a file, in its inode's pointers:
+        the index in 'i_block', followed by the index inside each indirect block that we go through
+        (like ext2_block_to_path in Linux). E.g. [5] (direct), [12, i], [13, i, j] or [14, i, j, k].
+        """
+        pointers_per_block = self.block_size // 4
+        if logical_block < 12:
+            return [logical_block]
+        logical_block -= 12
+        if logical_block < pointers_per_block:
+            return [12, logical_block]
+        logical_block -= pointers_per_block
+        if logical_block < pointers_per_block**2:
+            return [13, *divmod(logical_block, pointers_per_block)]
+        logical_block -= pointers_per_block**2
+        if logical_block < pointers_per_block**3:
+            i, rest = divmod(logical_block, pointers_per_block**2)
+            return [14, i, *divmod(rest, pointers_per_block)]
+        raise IndexError("logical block out of range")
+
+    def _follow_path(self, i_block, path):
+        """
+        Internal method that follows a path (see '_block_to_path') from the 'i_block' pointers
+        of an inode, reading one pointer of each indirect block on the way, and returns the block
+        number where it ends (0 if there's a null pointer on the way, that is, a hole).
+        """
+        block_number = i_block[path[0]]
+        for index in path[1:]:
+            if block_number == 0:
+                return 0
+            block_number = _POINTER.unpack_from(self.read_block(block_number), index*4)[0]
+        return block_number
+
+    def _resolve_logical_block(self, i_block, logical_block):
+        """
+        Method that returns the block number of a logical block of a file (given its inode's
+        'i_block' pointers), reading at most 3 indirect blocks (0 if it's a hole).
+        """
+        return self._follow_path(i_block, self._block_to_path(logical_block))
+
+    def _without_holes(self, inode_obj, block_count):
+        """
+        Internal method that tells whether a file (its inode) has all its 'block_count' data blocks allocated,
+        comparing the blocks that it should have (data + indirect blocks) with the ones it has (i_blocks).
+        """
+        pointers_per_block = self.block_size // 4
+        indirect_blocks = 0
+        remaining = block_count - 12
+        if remaining > 0: # simple indirect block
+            indirect_blocks += 1
+            remaining -= pointers_per_block
+        if remaining > 0: # double indirect block, and its simple indirect blocks
+            indirect_blocks += 1 + min(ceil(remaining / pointers_per_block), pointers_per_block)
+            remaining -= pointers_per_block**2
+        if remaining > 0: # triple indirect block, and its double and simple indirect blocks
+            indirect_blocks += 1 + ceil(remaining / pointers_per_block**2) + ceil(remaining / pointers_per_block)
+        if inode_obj.i_file_acl != 0: # the block with the extended attributes also counts
+            indirect_blocks += 1
+        return inode_obj.i_blocks * 512 == (block_count + indirect_blocks) * self.block_size # (i_blocks is in units of 512 bytes)
+
+    def _iter_data_block_numbers(self, i_block):
+        """
+        Internal generator that yields, in logical order, the data block numbers pointed by
+        the 'i_block' pointers of an inode, as arrays: first the direct ones, and then
+        those of each simple indirect block (directly, or through a double/triple indirect block).
+        Unlike the _parse_X_block methods, the null pointers (holes) are kept as 0's,
+        so that the position of each block number is its logical block number (see _BlockMap).
+        A null indirect block reads as zeros (see read_blocks), so it gives all the 0's of the
+        blocks it would cover (only as far as they are asked for, it's a generator after all).
+        """
+        yield array("I", i_block[0:12])
+        yield from self._iter_indirect_2_pointers(i_block[12:13], holes=True)
+        for raw_indirect_2_block in self.read_blocks(i_block[13:14]):
+            yield from self._iter_indirect_2_pointers(_all_block_pointers(raw_indirect_2_block), holes=True)
+        for raw_indirect_3_block in self.read_blocks(i_block[14:15]):
+            for raw_indirect_2_block in self.read_blocks(_all_block_pointers(raw_indirect_3_block)):
+                yield from self._iter_indirect_2_pointers(_all_block_pointers(raw_indirect_2_block), holes=True)
 
 
     def open(self, path):
@@ -569,33 +1102,55 @@ class Ext2:
         (among other things).
         """
         path = path.encode(ENCODING) # ext2 is case sensitive, so I handle the path as it comes.
-        parts = path.split(b'/')[1:] # we decompose the path in a list with the directory/file names.
-        obj = self.root # we always start from the root directory.
+        obj = self.root # we start from the root directory,
+        inode_number = 2 # (the root directory's inode, see Ext2's constructor)
+        prefix = b''
+        # or from the deepest directory of the path that was already opened (a walker opens many paths in the same directories).
+        cached_prefix = path.rpartition(b'/')[0]
+        while cached_prefix:
+            cached = _cache_get(self._path_cache, cached_prefix)
+            if cached is not None:
+                obj, inode_number = cached
+                prefix = cached_prefix
+                break
+            cached_prefix = cached_prefix.rpartition(b'/')[0]
+        parts = path[len(prefix):].split(b'/')[1:] # we decompose the (rest of the) path in a list with the directory/file names.
         if path != b'/': # in case we want to open only the root.
             for name in parts: # We will go into directory by directory until we reach the file or directory we are looking for.
-                try:
-                    # we make a dictionary <name: inode> from the directory entries of the current directory.
-                    files = {f.name:f.inode for f in obj.files}
-                except AttributeError:
-                    # in case something like this happens: /dir_1/file.txt/dir_2
-                    # a file can only be at the end of the path, not in the middle (everything else must be directories).
-                    raise FileNotFoundError(f"{obj.path} is not a Directory!") # we will see this exception by console.
-                if name in files: # we verify that the searched directory/file name is in a directory entry of the current directory.
-                    # We locate, read and parse the inode
-                    inode_number = files[name]
-                    raw_inode = self.read_inode(inode_number)
-                    inode_obj = inode.Inode(raw_inode)
-                    # and we instantiate the directory or file as of the inode that represents it.
-                    if inode_obj.i_mode[0] == 'd': # Maybe this way of checking the file type needs to be improved.
-                        obj = Directory(self, inode_obj, name, parent=obj)
-                    else:
-                        obj = FileHandle(self, inode_obj, name, parent=obj) # if we get here before finishing the 'for', the exception 'AttributeError' will be thrown above.
+                # if we already found this name in this directory (in a previous 'open'), we know its inode number
+                # without going through the directory entries (the Directory objects don't read anything until then, see Directory.files).
+                child_inode_number = _cache_get(self._dentry_cache, (inode_number, name))
+                if child_inode_number is None:
+                    if not isinstance(obj, Directory):
+                        # in case something like this happens: /dir_1/file.txt/dir_2
+                        # a file can only be at the end of the path, not in the middle (everything else must be directories).
+                        raise FileNotFoundError(f"{obj.path} is not a Directory!") # we will see this exception by console.
+                    # we look for the name in the <name: inode> dictionary of the current directory (it's built only once per Directory).
+                    child_inode_number = obj.name_to_inode.get(name)
+                    if child_inode_number is None: # the searched directory/file name is not in a directory entry of the current directory.
+                        raise FileNotFoundError(f"No such file or directory {obj.path}/{name.decode(ENCODING)}")
+                    _cache_put(self._dentry_cache, (inode_number, name), child_inode_number, DENTRY_CACHE_SIZE)
+                # We locate, read and parse the inode (or take it from the cache)
+                inode_number = child_inode_number
+                inode_obj = self._get_inode(inode_number)
+                # and we instantiate the directory or file as of the inode that represents it.
+                prefix += b'/' + name
+                if inode_obj.raw_type == 0x4: # a directory (see inode.file_types), checked on the number, not on the 'i_mode' string.
+                    obj = Directory(self, inode_obj, name, parent=obj)
+                    _cache_put(self._path_cache, prefix, (obj, inode_number), PATH_CACHE_SIZE)
                 else:
-                    raise FileNotFoundError(f"No such file or directory {obj.path}/{name.decode(ENCODING)}")
+                    obj = FileHandle(self, inode_obj, name, parent=obj) # if we get here before finishing the 'for', the 'not a Directory' exception will be raised above.
             
         return obj
 
     # I don't know if it's the proper method name, but I wanted to put the 'close' here.
     def unmount(self):
+        if self._mm is not None:
+            self._mm_view.release()
+            try:
+                self._mm.close()
+            except BufferError:
+                pass # there are still views of some blocks around (e.g. in a FileHandle), the mapping will be closed when they're gone.
+            self._mm = self._mm_view = None
         self.handle.close()
         return True
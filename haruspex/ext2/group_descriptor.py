@@ -6,6 +6,9 @@
 
 import struct
 
+# The whole structure (32 bytes) is parsed with a single unpack (the last 3 values are 'bg_reserved')
+_GD_STRUCT = struct.Struct("<IIIHHHHIII")
+
 class GroupDescriptor:
     """
     Class representing a Group Descriptor of an ext2 filesystem.
@@ -15,31 +18,44 @@ class GroupDescriptor:
     that is, each entry contains the information of each block group in the filesystem.
     (yes, just like the superblock, there is a copy of this table in each block group)
     """
+    # (no per-instance dict)
+    __slots__ = (
+        "_raw_data",
+        "bg_block_bitmap",      # Block number of block bitmap
+        "bg_inode_bitmap",      # Block number of inode bitmap
+        "bg_inode_table",       # Block number of first inode table block
+        "bg_free_blocks_count", # Number of free blocks in the group
+        "bg_free_inodes_count", # Number of free inodes in the group
+        "bg_used_dirs_count",   # Number of directories in the group
+        "bg_pad",               # 16bit value used for padding the structure on a 32bit boundary (Alignment to word)
+        "bg_reserved",          # 12 bytes of reserved space for future revisions (Nulls to pad out 32 bytes)
+    )
+    # All the fields are stored just as they come, so they are plain attributes
+    # (a property would cost a function call on every access, and 'bg_inode_table' is used on every inode read).
+
     def __init__(self, data=bytes(32),
                  bg_block_bitmap=None, bg_inode_bitmap=None, bg_inode_table=None,
                  bg_free_blocks_count=None, bg_free_inodes_count=None,
                  bg_used_dirs_count=None, bg_pad=None, bg_reserved=None
                  ):
         
-        p_bg_block_bitmap      = struct.unpack("<I", data[0:4])[0]
-        p_bg_inode_bitmap      = struct.unpack("<I", data[4:8])[0]
-        p_bg_inode_table       = struct.unpack("<I", data[8:12])[0]
-        p_bg_free_blocks_count = struct.unpack("<H", data[12:14])[0]
-        p_bg_free_inodes_count = struct.unpack("<H", data[14:16])[0]
-        p_bg_used_dirs_count   = struct.unpack("<H", data[16:18])[0]
-        p_bg_pad               = struct.unpack("<H", data[18:20])[0]
-        p_bg_reserved          = struct.unpack("<III", data[20:32])
+        (p_bg_block_bitmap, p_bg_inode_bitmap, p_bg_inode_table,
+         p_bg_free_blocks_count, p_bg_free_inodes_count, p_bg_used_dirs_count, p_bg_pad,
+         *p_bg_reserved) = _GD_STRUCT.unpack_from(data)
+        p_bg_reserved = tuple(p_bg_reserved)
 
         self._raw_data = data
 
-        self.bg_block_bitmap      = bg_block_bitmap      or p_bg_block_bitmap
-        self.bg_inode_bitmap      = bg_inode_bitmap      or p_bg_inode_bitmap
-        self.bg_inode_table       = bg_inode_table       or p_bg_inode_table
-        self.bg_free_blocks_count = bg_free_blocks_count or p_bg_free_blocks_count
-        self.bg_free_inodes_count = bg_free_inodes_count or p_bg_free_inodes_count
-        self.bg_used_dirs_count   = bg_used_dirs_count   or p_bg_used_dirs_count
-        self.bg_pad               = bg_pad               or p_bg_pad
-        self.bg_reserved          = bg_reserved          or p_bg_reserved
+        # The values passed as arguments (if any) take the place of the parsed ones ('is None', so that a 0 can be passed too).
+        # (the parsed values are already ints, only the arguments are converted)
+        self.bg_block_bitmap      = p_bg_block_bitmap      if bg_block_bitmap      is None else int(bg_block_bitmap)
+        self.bg_inode_bitmap      = p_bg_inode_bitmap      if bg_inode_bitmap      is None else int(bg_inode_bitmap)
+        self.bg_inode_table       = p_bg_inode_table       if bg_inode_table       is None else int(bg_inode_table)
+        self.bg_free_blocks_count = p_bg_free_blocks_count if bg_free_blocks_count is None else int(bg_free_blocks_count)
+        self.bg_free_inodes_count = p_bg_free_inodes_count if bg_free_inodes_count is None else int(bg_free_inodes_count)
+        self.bg_used_dirs_count   = p_bg_used_dirs_count   if bg_used_dirs_count   is None else int(bg_used_dirs_count)
+        self.bg_pad               = p_bg_pad               if bg_pad               is None else bg_pad
+        self.bg_reserved          = p_bg_reserved          if bg_reserved          is None else bg_reserved
 
         # 'bg_': block group ; 'p_': parsed
 
@@ -57,98 +73,6 @@ class GroupDescriptor:
 
     # ---
 
-    @property
-    def bg_block_bitmap(self):
-        """
-        Block number of block bitmap.
-        """
-        return self._bg_block_bitmap
-
-    @bg_block_bitmap.setter
-    def bg_block_bitmap(self, value):
-        self._bg_block_bitmap = int(value)
-
-    @property
-    def bg_inode_bitmap(self):
-        """
-        Block number of inode bitmap.
-        """
-        return self._bg_inode_bitmap
-
-    @bg_inode_bitmap.setter
-    def bg_inode_bitmap(self, value):
-        self._bg_inode_bitmap = int(value)
-
-    @property
-    def bg_inode_table(self):
-        """
-        Block number of first inode table block.
-        """
-        return self._bg_inode_table
-
-    @bg_inode_table.setter
-    def bg_inode_table(self, value):
-        self._bg_inode_table = int(value)
-
-    @property
-    def bg_free_blocks_count(self):
-        """
-        Number of free blocks in the group.
-        """
-        return self._bg_free_blocks_count
-
-    @bg_free_blocks_count.setter
-    def bg_free_blocks_count(self, value):
-        self._bg_free_blocks_count = int(value)
-
-    @property
-    def bg_free_inodes_count(self):
-        """
-        Number of free inodes in the group.
-        """
-        return self._bg_free_inodes_count
-
-    @bg_free_inodes_count.setter
-    def bg_free_inodes_count(self, value):
-        self._bg_free_inodes_count = int(value)
-
-    @property
-    def bg_used_dirs_count(self):
-        """
-        Number of directories in the group.
-        """
-        return self._bg_used_dirs_count
-
-    @bg_used_dirs_count.setter
-    def bg_used_dirs_count(self, value):
-        self._bg_used_dirs_count = int(value)
-
-    @property
-    def bg_pad(self):
-        """
-        16bit value used for padding the structure on a 32bit boundary.
-        (Alignment to word)
-        """
-        return self._bg_pad
-
-    @bg_pad.setter
-    def bg_pad(self, value):
-        self._bg_pad = value
-
-    @property
-    def bg_reserved(self):
-        """
-        12 bytes of reserved space for future revisions.
-        (Nulls to pad out 32 bytes)
-        """
-        return self._bg_reserved
-
-    @bg_reserved.setter
-    def bg_reserved(self, value):
-        self._bg_reserved = value
-
-    # ---
-
     def __str__(self):
         return (
                 f"Block number of block bitmap:            {self.bg_block_bitmap}\n"
@@ -13,6 +13,8 @@
 
 import datetime
 import struct
+import sys
+from array import array
 
 # Types of files recognized by Ext2 (used in 'i_mode' field)
 file_types = {
@@ -34,6 +36,17 @@ access_rights = {
     4: 'r', # read    (b: 100)
 }
 
+# The base structure of an inode (128 bytes) is parsed with a single unpack
+# (the 60 bytes skipped after 'osd1' are 'i_block', which is loaded apart as an array, and the last 3 values are 'osd2')
+_INODE_STRUCT = struct.Struct("<HHIIIIIHHIII60xIIII3I")
+
+# Access rights string (like 'rwxr-xr-x') for each of the 512 possible values of the 9 access rights bits of 'i_mode'
+# (built once, so that parsing 'i_mode' is just a lookup, see Inode.i_mode)
+_RIGHTS_STRINGS = tuple(
+    "".join(access_rights[(r >> shift) & bit] for shift in (6, 3, 0) for bit in (0b100, 0b010, 0b001))
+    for r in range(0o1000)
+)
+
 N_FLAGS = 14 # in case in the future I parse more (max 32)
 
 # Flags indicate how ext2 should behave when accessing data pointed to by an inode.
@@ -73,6 +86,34 @@ class Inode:
       if revision of ext2 > 0 -> 128 bytes <= inode_size <= block_size, and is a perfect power of 2
     (the superblock is who knows the value of inode_size, block_size and the revision of ext2)
     """
+    # One of these per opened file/directory (and per cached inode, see Ext2._get_inode), so we avoid the per-instance dict.
+    __slots__ = (
+        "_raw_data",
+        "_i_mode",       # (see 'i_mode')
+        "_i_mode_str",   # (the formatted-string of 'i_mode', see its setter)
+        "raw_type",      # File type, as the number in the top 4 bits of 'i_mode' (see 'file_types')
+        "i_uid",         # Owner identifier
+        "i_size",        # Effective length of the file in bytes
+        "_i_atime", "_i_ctime", "_i_mtime", "_i_dtime", # (see 'i_atime', 'i_ctime', 'i_mtime', 'i_dtime')
+        "i_gid",         # Group identifier
+        "i_links_count", # Hard links counter
+        "i_blocks",      # Number of data blocks (in units of 512 bytes) that have been allocated to the file (count of disk sectors)
+        "_i_flags",      # (see 'i_flags')
+        "_i_flags_str",  # (the formatted-string of 'i_flags', see its setter)
+        "osd1",          # Specific operating system information (4 bytes)
+        "i_block",       # Pointers to data blocks (12 direct and 3 indirect), in an array of unsigned ints (see below)
+        "i_generation",  # File version (used when the file is accessed by a network filesystem)
+        "i_file_acl",    # File access control list
+        "i_dir_acl",     # Directory access control list (is not used for regular files)
+        "i_faddr",       # Fragment address
+        "osd2",          # Specific operating system information (12 bytes)
+    )
+    # The fields that are stored just as they come (without any parsing) are plain attributes,
+    # since a property costs a function call on every access (and 'i_size' or 'i_block' are used all the time).
+    # The ones that show something different from what's stored (dates, type/rights, flags) are still properties.
+    # About 'i_block': pointers to 0 are equal to null pointers, which means there is no block assigned/allocated yet.
+    # Otherwise, the value stored in the pointer is the block number that it refers to.
+
     def __init__(self, data=bytes(128),
                  i_mode=None, i_uid=None, i_size=None, i_atime=None, i_ctime=None,
                  i_mtime=None, i_dtime=None, i_gid=None, i_links_count=None,
@@ -80,45 +121,41 @@ class Inode:
                  i_file_acl=None, i_dir_acl=None, i_faddr=None, osd2=None
                  ):
 
-        p_i_mode        = struct.unpack("<H", data[0:2])[0]
-        p_i_uid         = struct.unpack("<H", data[2:4])[0]
-        p_i_size        = struct.unpack("<I", data[4:8])[0]
-        p_i_atime       = struct.unpack("<I", data[8:12])[0]
-        p_i_ctime       = struct.unpack("<I", data[12:16])[0]
-        p_i_mtime       = struct.unpack("<I", data[16:20])[0]
-        p_i_dtime       = struct.unpack("<I", data[20:24])[0]
-        p_i_gid         = struct.unpack("<H", data[24:26])[0]
-        p_i_links_count = struct.unpack("<H", data[26:28])[0]
-        p_i_blocks      = struct.unpack("<I", data[28:32])[0]
-        p_i_flags       = struct.unpack("<I", data[32:36])[0]
-        p_osd1          = struct.unpack("<I", data[36:40])[0]
-        p_i_block       = struct.unpack("<IIIIIIIIIIIIIII", data[40:100])
-        p_i_generation  = struct.unpack("<I", data[100:104])[0]
-        p_i_file_acl    = struct.unpack("<I", data[104:108])[0]
-        p_i_dir_acl     = struct.unpack("<I", data[108:112])[0]
-        p_i_faddr       = struct.unpack("<I", data[112:116])[0]
-        p_osd2          = struct.unpack("<III", data[116:128])
+        fields = _INODE_STRUCT.unpack_from(data) # (the inode may be larger than 128 bytes, we only parse those)
+        (p_i_mode, p_i_uid, p_i_size, p_i_atime, p_i_ctime, p_i_mtime, p_i_dtime,
+         p_i_gid, p_i_links_count, p_i_blocks, p_i_flags, p_osd1) = fields[0:12]
+        p_i_generation, p_i_file_acl, p_i_dir_acl, p_i_faddr = fields[12:16]
+        p_osd2 = fields[16:19]
+        # the block pointers are loaded straight from the bytes into an array (4 bytes each, like in Ext2's indirect blocks),
+        # instead of unpacking 15 ints and copying them into a list.
+        p_i_block = array("I")
+        p_i_block.frombytes(data[40:100])
+        if sys.byteorder == "big":
+            p_i_block.byteswap() # ext2 structures are stored in little endian
 
         self._raw_data = data
 
-        self.i_mode        = i_mode        or p_i_mode
-        self.i_uid         = i_uid         or p_i_uid
-        self.i_size        = i_size        or p_i_size
-        self.i_atime       = i_atime       or p_i_atime
-        self.i_ctime       = i_ctime       or p_i_ctime
-        self.i_mtime       = i_mtime       or p_i_mtime
-        self.i_dtime       = i_dtime       or p_i_dtime
-        self.i_gid         = i_gid         or p_i_gid
-        self.i_links_count = i_links_count or p_i_links_count
-        self.i_blocks      = i_blocks      or p_i_blocks
-        self.i_flags       = i_flags       or p_i_flags
-        self.osd1          = osd1          or p_osd1
-        self.i_block       = i_block       or p_i_block
-        self.i_generation  = i_generation  or p_i_generation
-        self.i_file_acl    = i_file_acl    or p_i_file_acl
-        self.i_dir_acl     = i_dir_acl     or p_i_dir_acl
-        self.i_faddr       = i_faddr       or p_i_faddr
-        self.osd2          = osd2          or p_osd2
+        # The values passed as arguments (if any) take the place of the parsed ones ('is None', so that a 0 can be passed too).
+        # The parsed values are already ints (or tuples), so the plain attributes take them as they are,
+        # and only the arguments are converted (the fields with properties do their own parsing in the setters).
+        self.i_mode        = p_i_mode        if i_mode        is None else i_mode
+        self.i_uid         = p_i_uid         if i_uid         is None else i_uid
+        self.i_size        = p_i_size        if i_size        is None else int(i_size)
+        self.i_atime       = p_i_atime       if i_atime       is None else i_atime
+        self.i_ctime       = p_i_ctime       if i_ctime       is None else i_ctime
+        self.i_mtime       = p_i_mtime       if i_mtime       is None else i_mtime
+        self.i_dtime       = p_i_dtime       if i_dtime       is None else i_dtime
+        self.i_gid         = p_i_gid         if i_gid         is None else i_gid
+        self.i_links_count = p_i_links_count if i_links_count is None else int(i_links_count)
+        self.i_blocks      = p_i_blocks      if i_blocks      is None else int(i_blocks)
+        self.i_flags       = p_i_flags       if i_flags       is None else i_flags
+        self.osd1          = p_osd1          if osd1          is None else osd1
+        self.i_block       = p_i_block       if i_block       is None else array("I", i_block)
+        self.i_generation  = p_i_generation  if i_generation  is None else i_generation
+        self.i_file_acl    = p_i_file_acl    if i_file_acl    is None else i_file_acl
+        self.i_dir_acl     = p_i_dir_acl     if i_dir_acl     is None else i_dir_acl
+        self.i_faddr       = p_i_faddr       if i_faddr       is None else i_faddr
+        self.osd2          = p_osd2          if osd2          is None else osd2
 
         # 'i_': inode ; 'p_': parsed
 
@@ -144,57 +181,18 @@ class Inode:
 
         Returns a formatted-string (based on how it actually shows on Linux)
         """
-        f_type   = self._i_mode >> 12
-        permissions = f"{file_types[f_type]}"
-
-        f_rights = self._i_mode & 0x0fff
-
-        # process control bits (I don't really concatenate them in the final string, for now)
-        set_process_user_id =  ((f_rights & 0b100000000000) >> 11) == 1
-        set_process_group_id = ((f_rights & 0b010000000000) >> 10) == 1
-        sticky_bit =           ((f_rights & 0b001000000000) >>  9) == 1
-
-        # access rights bits
-        owner_rights = (f_rights & 0b000111000000) >> 6
-        group_rights = (f_rights & 0b000000111000) >> 3
-        other_rights = (f_rights & 0b000000000111)
-
-        rights = [owner_rights, group_rights, other_rights]
-
-        for r in rights:
-            permissions += access_rights[r & 0b100] # each bit has a meaning
-            permissions += access_rights[r & 0b010]
-            permissions += access_rights[r & 0b001]
-
-        # permissions += f"{set_process_user_id} {set_process_group_id} {sticky_bit}"
-
-        return permissions
+        return self._i_mode_str
 
     @i_mode.setter
     def i_mode(self, value):
         self._i_mode = int(value)
+        self.raw_type = self._i_mode >> 12 # (to check the type without going through the string, e.g. raw_type == 0x4 for directories)
 
-    @property
-    def i_uid(self):
-        """
-        Owner identifier
-        """
-        return self._i_uid
-
-    @i_uid.setter
-    def i_uid(self, value):
-        self._i_uid = value
-
-    @property
-    def i_size(self):
-        """
-        Effective length of the file in bytes
-        """
-        return self._i_size
-
-    @i_size.setter
-    def i_size(self, value):
-        self._i_size = int(value)
+        # The string is built here (once), and not each time it's asked for:
+        # the type comes from the top 4 bits, and the access rights (the bottom 9 bits) from a precomputed table.
+        # (the process control bits, setuid/setgid/sticky, are not shown in the string, for now)
+        # (as this runs on every parsed inode, a type that isn't in 'file_types' (e.g. garbage in a deleted inode) shows as 'u')
+        self._i_mode_str = file_types.get(self.raw_type, 'u') + _RIGHTS_STRINGS[self._i_mode & 0o777]
 
     # ---------------------------------------------------------
 
@@ -206,21 +204,23 @@ class Inode:
     # 'POSIX time' to local time (it converts it to our time zone, not to UTC 0, which comes in handy)
     # See: https://docs.python.org/3/library/datetime.html#datetime.datetime.fromtimestamp
     # So, I will represent the timestamps with DateTime objects.
+    # (but I only build them when they're asked for: the setters keep the seconds as they come,
+    # since most inodes are parsed just to get to their blocks, and never show their dates)
 
     @property
     def i_atime(self):
         """
         Last access timestamp
         """
-        # https://docs.python.org/3/library/datetime.html#datetime.datetime.timestamp
-        ts = self._i_atime if self._i_atime.timestamp() > 0. else None # if seconds elapsed since Unix epoch > 0.
+        # https://docs.python.org/3/library/datetime.html#datetime.datetime.fromtimestamp
+        ts = datetime.datetime.fromtimestamp(self._i_atime, tz=datetime.timezone.utc) if self._i_atime > 0 else None # if seconds elapsed since Unix epoch > 0.
         return ts
 
     @i_atime.setter
     def i_atime(self, value):
         # value: seconds elapsed since Unix epoch
         #self._i_atime = datetime.datetime.fromtimestamp(value) # DateTime object
-        self._i_atime = datetime.datetime.fromtimestamp(value, tz=datetime.timezone.utc)
+        self._i_atime = value # (the DateTime object is built in the getter, with tz=datetime.timezone.utc)
         # last edit: for now I keep the date as it comes, I don't convert it to the current PC time zone.
 
         # > According to what I researched, the dates should be written to the filesystem in UTC+0,
@@ -234,171 +234,61 @@ class Inode:
         """
         Metadata last modification timestamp (inode)
         """
-        ts = self._i_ctime if self._i_ctime.timestamp() > 0. else None
+        ts = datetime.datetime.fromtimestamp(self._i_ctime, tz=datetime.timezone.utc) if self._i_ctime > 0 else None
         return ts
 
     @i_ctime.setter
     def i_ctime(self, value):
         #self._i_ctime = datetime.datetime.fromtimestamp(value)
-        self._i_ctime = datetime.datetime.fromtimestamp(value, tz=datetime.timezone.utc)
+        self._i_ctime = value
 
     @property
     def i_mtime(self):
         """
         Data last modification timestamp (file contents)
         """
-        ts = self._i_mtime if self._i_mtime.timestamp() > 0. else None
+        ts = datetime.datetime.fromtimestamp(self._i_mtime, tz=datetime.timezone.utc) if self._i_mtime > 0 else None
         return ts
 
     @i_mtime.setter
     def i_mtime(self, value):
         #self._i_mtime = datetime.datetime.fromtimestamp(value)
-        self._i_mtime = datetime.datetime.fromtimestamp(value, tz=datetime.timezone.utc)
+        self._i_mtime = value
 
     @property
     def i_dtime(self):
         """
         Deletion timestamp        
         """
-        ts = self._i_dtime if self._i_dtime.timestamp() > 0. else None
+        ts = datetime.datetime.fromtimestamp(self._i_dtime, tz=datetime.timezone.utc) if self._i_dtime > 0 else None
         return ts
 
     @i_dtime.setter
     def i_dtime(self, value):
         #self._i_dtime = datetime.datetime.fromtimestamp(value)
-        self._i_dtime = datetime.datetime.fromtimestamp(value, tz=datetime.timezone.utc)
+        self._i_dtime = value
 
     # ---------------------------------------------------------
 
-    @property
-    def i_gid(self):
-        """
-        Group identifier
-        """
-        return self._i_gid
-
-    @i_gid.setter
-    def i_gid(self, value):
-        self._i_gid = value
-
-    @property
-    def i_links_count(self):
-        """
-        Hard links counter
-        """
-        return self._i_links_count
-
-    @i_links_count.setter
-    def i_links_count(self, value):
-        self._i_links_count = int(value)
-
-    @property
-    def i_blocks(self):
-        """
-        Number of data blocks (in units of 512 bytes) that have been allocated
-        to the file (count of disk sectors).
-        """
-        return self._i_blocks
-
-    @i_blocks.setter
-    def i_blocks(self, value):
-        self._i_blocks = int(value)
-
     @property
     def i_flags(self):
         """
         Returns a formated-string with the flags of the file
         """
-        flag_list = []
-        for b in range(0, N_FLAGS):         # I parse (for now) only 'n' bits of the 32 that "_i_flags" has.
-            k = self._i_flags & (0b1 << b)  # I am applying masks of the type 1, 10, 100, 1000 ... (bits).
-            if k != 0:
-                flag_list.append(file_flags[k]) # the bits 0s will represent an empty string, and the 1s, a flag.
-        return ", ".join(flag_list) # I do this to make the string look "better".
-        # I'm not sure if this could be done with a "List Comprehension".
+        return self._i_flags_str
 
     @i_flags.setter
     def i_flags(self, value):
         self._i_flags = int(value)
 
-    @property
-    def osd1(self):
-        """
-        Specific operating system information (4 bytes)
-        """
-        return self._osd1
-
-    @osd1.setter
-    def osd1(self, value):
-        self._osd1 = value
-
-    @property
-    def i_block(self):
-        """
-        Pointers to data blocks (12 direct and 3 indirect). I will store them in a list.
-        Pointers to 0 are equal to null pointers, which means there is no block assigned/allocated yet.
-        Otherwise, the value stored in the pointer is the block number that it refers to.
-        """
-        return self._i_block
-
-    @i_block.setter
-    def i_block(self, value):
-        self._i_block = list(value)
-
-    @property
-    def i_generation(self):
-        """
-        File version (used when the file is accessed by a network filesystem)
-        """
-        return self._i_generation
-
-    @i_generation.setter
-    def i_generation(self, value):
-        self._i_generation = value
-
-    @property
-    def i_file_acl(self):
-        """
-        File access control list
-        """
-        return self._i_file_acl
-
-    @i_file_acl.setter
-    def i_file_acl(self, value):
-        self._i_file_acl = value
-
-    @property
-    def i_dir_acl(self):
-        """
-        Directory access control list (is not used for regular files)
-        """
-        return self._i_dir_acl
-
-    @i_dir_acl.setter
-    def i_dir_acl(self, value):
-        self._i_dir_acl = value
-
-    @property
-    def i_faddr(self):
-        """
-        Fragment address
-        """
-        return self._i_faddr
-
-    @i_faddr.setter
-    def i_faddr(self, value):
-        self._i_faddr = value
-
-    @property
-    def osd2(self):
-        """
-        Specific operating system information (12 bytes)
-        """
-        return self._osd2
-
-    @osd2.setter
-    def osd2(self, value):
-        self._osd2 = value
+        # The string is built here (once), and not each time it's asked for.
+        # 'file_flags' has a mask per flag (in bit order), so we keep the names of the masks that are set
+        # (I parse (for now) only the first N_FLAGS bits of the 32 that "_i_flags" has, the ones in 'file_flags').
+        # And most inodes don't have any flag set, so in that case we skip the loop.
+        if self._i_flags == 0:
+            self._i_flags_str = ""
+        else:
+            self._i_flags_str = ", ".join(name for mask, name in file_flags.items() if self._i_flags & mask)
 
     def __str__(self):
         return (
@@ -413,7 +303,7 @@ class Inode:
                 f"Hard links counter:                   {self.i_links_count}\n"
                 f"Number of data blocks of the file:    {self.i_blocks} (in units of 512 bytes)\n"
                 f"File flags:                           {self.i_flags}\n"
-                f"Direct pointers to data blocks:       {self.i_block[0:12]}\n"
+                f"Direct pointers to data blocks:       {list(self.i_block[0:12])}\n"
                 f"Pointer to simple indirect block:     {self.i_block[12]}\n"
                 f"Pointer to doubly-indirect block:     {self.i_block[13]}\n"
                 f"Pointer to triply-indirect block:     {self.i_block[14]}\n"
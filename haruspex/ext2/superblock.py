@@ -2,7 +2,6 @@
 #  - decide if the 'getter' thing should go in the 'setter' (in s_log_block_size and s_state).
 #    -> FOR NOW LET EVERYTHING STAY AS IT IS NOW
 #  - check if the superblock's own methods/operations (defined last) should be implemented somewhere.
-#  - what I commented in 's_uuid.setter'.
 #  - maybe it would be necessary to implement the getter of 's_feature_compat',
 #    's_feature_incompat' and 's_feature_ro_compat' (https://www.nongnu.org/ext2-doc/ext2.html#s-feature-compat).
 #  - maybe it would be necessary to implement the getter of 's_algo_bitmap' (https://www.nongnu.org/ext2-doc/ext2.html#s-algo-bitmap).
@@ -10,10 +9,65 @@
 
 import datetime
 import struct
+import uuid
 
 # Volume name and Pathname of last mount point encoding
 ENCODING = 'latin-1' # generally latin-1 is used
 
+# The first 208 bytes of the superblock (everything up to 's_reserved') are parsed with a single unpack
+# ('I' represents a 32-bit unsigned int, 'i' a 32-bit signed int, 'H' 16 bits and 'B' 8 bits;
+#  the '16s' are 's_uuid' and 's_volume_name', and '64s' is 's_last_mounted').
+# See more in: https://docs.python.org/3/library/struct.html
+_SB_STRUCT = struct.Struct("<IIIIIIIiIIIIIHHHHHHIIIIHHIHHIII16s16s64sIBBH")
+
+# Status of the filesystem (used in 's_state' field)
+filesystem_states = {
+    0: "the filesystem is mounted or was not cleanly unmounted",
+    1: "the filesystem was cleanly unmounted",
+    2: "the filesystem contains errors",
+}
+
+# What the filesystem driver should do when detecting errors (used in 's_errors' field)
+error_behaviors = {
+    1: "continue as if nothing happened",
+    2: "remount read-only",
+    3: "cause a kernel panic",
+}
+
+# OS where the filesystem was created (used in 's_creator_os' field)
+creator_oses = {
+    0: "Linux",
+    1: "GNU HURD",
+    2: "MASIX",
+    3: "FreeBSD",
+    4: "Lites",
+}
+
+# Value of 's_magic' that identifies the filesystem as ext2 (or ext3/ext4)
+EXT2_SUPER_MAGIC = 0xEF53
+
+# 's_inodes_count' and 's_blocks_count' are the first two fields of the superblock (see peek_counts)
+_COUNTS_STRUCT = struct.Struct("<II")
+
+
+def peek_magic(data, offset=0):
+    """
+    Returns the 's_magic' field of the superblock starting at 'offset' in 'data',
+    without building a Superblock (useful when probing a disk image for superblocks,
+    where almost none of the candidates is one: compare it against EXT2_SUPER_MAGIC
+    and only parse the whole thing when it matches).
+    """
+    return data[offset + 56] | (data[offset + 57] << 8) # little endian, 2 bytes
+
+
+def peek_counts(data, offset=0):
+    """
+    Returns the ('s_inodes_count', 's_blocks_count') pair of the superblock
+    starting at 'offset' in 'data', without building a Superblock.
+    """
+    return _COUNTS_STRUCT.unpack_from(data, offset)
+
+
 class Superblock:
     """
     Class representing the Superblock of an ext2 filesystem.
@@ -22,7 +76,68 @@ class Superblock:
 
     The superblock is always starting at the 1024th byte of the disk's partition,
     which normally happens to be the first byte of the 3rd sector (assuming 512-byte sectors).
+
+    NOTE: 's_magic' is an int (0xEF53 for ext2, so it can be compared against EXT2_SUPER_MAGIC);
+    it used to be returned as a hex string ('0xef53'), which is now only how __str__ shows it.
     """
+    # (no per-instance dict)
+    __slots__ = (
+        "_raw_data",
+        "s_inodes_count",      # Total number of inodes
+        "s_blocks_count",      # Filesystem size in blocks
+        "s_r_blocks_count",    # Number of reserved blocks
+        "s_free_blocks_count", # Free blocks counter (data blocks + directory-entry blocks)
+        # The inodes are each of the entries in the inode table, and this table has a calculable size.
+        # Creating an inode does not mean that a new block is allocated from the file system, but rather
+        # to fill in a new entry in the table. Therefore, "s_free_inodes_count" is an independent calculation of "s_free_blocks_count".
+        "s_free_inodes_count", # Free inodes counter
+        # It is the id of the block containing the superblock structure: always 0 for filesystems with
+        # a block size larger than 1KB, and always 1 for filesystems with a block size of 1KB,
+        # since the superblock is always starting at the 1024th byte of the disk's partition.
+        "s_first_data_block",  # Number of first useful block
+        "_s_log_block_size",   # (see 's_log_block_size')
+        "_s_log_frag_size",    # (see 's_log_frag_size')
+        "s_blocks_per_group",  # Number of blocks per group
+        "s_frags_per_group",   # Number of fragments per group
+        "s_inodes_per_group",  # Number of inodes per group
+        #
+        "_s_mtime", "_s_wtime", # (see 's_mtime', 's_wtime')
+        "s_mnt_count",         # Mount operations counter
+        "s_max_mnt_count",     # Number of mount operations before check
+        "s_magic",             # Magic signature, 16bit value identifying the file system as Ext2 (fixed to 0xEF53, see EXT2_SUPER_MAGIC)
+        "_s_state",            # (see 's_state')
+        "_s_errors",           # (see 's_errors')
+        "s_minor_rev_level",   # Minor revision level
+        "_s_lastcheck", "_s_checkinterval", # (see 's_lastcheck', 's_checkinterval')
+        "_s_creator_os",       # (see 's_creator_os')
+        "s_rev_level",         # Revision level (0: revision 0 ; 1: revision 1)
+        "s_def_resuid",        # Default User ID for reserved blocks (in Linux it is 0)
+        "s_def_resgid",        # Default Group ID for reserved blocks (in Linux it is 0)
+        #
+        # In revision 0, the first non-reserved inode is fixed to 11.
+        # In revision 1 and later this value may be set to any value.
+        "s_first_ino",         # Number of first nonreserved inode
+        # In revision 0, this value is always 128. In revision 1 and later, this value
+        # must be a perfect power of 2 and must be smaller or equal to the block size.
+        "s_inode_size",        # Size of on-disk inode structure
+        "s_block_group_nr",    # Block group number of this superblock (this can be used to rebuild the file system from any superblock backup)
+        #
+        "s_feature_compat",    # Compatible features bitmap
+        "s_feature_incompat",  # Incompatible features bitmap
+        "s_feature_ro_compat", # Read-only compatible features bitmap
+        "_s_uuid", "_s_uuid_str", # (see 's_uuid')
+        "_s_volume_name", "_s_volume_name_str",   # (see 's_volume_name')
+        "_s_last_mounted", "_s_last_mounted_str", # (see 's_last_mounted')
+        "s_algorithm_usage_bitmap", # Used for compression
+        "s_prealloc_blocks",        # Number of blocks to preallocate for regular files
+        "s_prealloc_dir_blocks",    # Number of blocks to preallocate for directories
+        #
+        "s_padding1",          # Alignment to word [2 bytes]
+        "s_reserved",          # Nulls to pad out 1,024 bytes [816 bytes] (when parsed, a memoryview into 'raw_data', not a copy)
+    )
+    # The fields that are stored just as they come are plain attributes (like in GroupDescriptor),
+    # only the ones that are formatted or checked on their way in or out keep a property.
+
     def __init__(self, data=bytes(1024),
                  s_inodes_count=None, s_blocks_count=None, s_r_blocks_count=None,
                  s_free_blocks_count=None, s_free_inodes_count=None, s_first_data_block=None,
@@ -35,106 +150,92 @@ class Superblock:
                  s_block_group_nr=None, s_feature_compat=None, s_feature_incompat=None,
                  s_feature_ro_compat=None, s_uuid=None, s_volume_name=None,
                  s_last_mounted=None, s_algorithm_usage_bitmap=None, s_prealloc_blocks=None,
-                 s_prealloc_dir_blocks=None, s_padding1=None, s_reserved=None
+                 s_prealloc_dir_blocks=None, s_padding1=None, s_reserved=None,
+                 validate=False
                  ):
         
+        # With 'validate', we take a quick look at the magic signature before anything else: if it's not there,
+        # these bytes are not an ext2 superblock and there's no point in parsing the rest (see peek_magic).
+        # (it's off by default, so that a Superblock can still be built from scratch, like Superblock(s_log_block_size=1))
+        if validate:
+            magic = peek_magic(data)
+            if magic != EXT2_SUPER_MAGIC:
+                raise ValueError(f"not an ext2 superblock (magic signature {magic:#06x}, expected {EXT2_SUPER_MAGIC:#06x})")
+
         # All fields in the superblock (as in all other ext2 structures) are stored
-        # on the disk in little endian format (<)
-
-        # 'I' represents a 32-bit unsigned int format
-        # 'i' represents a 32-bit signed int format
-        # See more in: https://docs.python.org/3/library/struct.html
-
-        p_s_inodes_count      = struct.unpack("<I", data[0:4])[0]
-        p_s_blocks_count      = struct.unpack("<I", data[4:8])[0]
-        p_s_r_blocks_count    = struct.unpack("<I", data[8:12])[0]
-        p_s_free_blocks_count = struct.unpack("<I", data[12:16])[0]
-        p_s_free_inodes_count = struct.unpack("<I", data[16:20])[0]
-        p_s_first_data_block  = struct.unpack("<I", data[20:24])[0]
-        p_s_log_block_size    = struct.unpack("<I", data[24:28])[0]
-        p_s_log_frag_size     = struct.unpack("<i", data[28:32])[0]
-        p_s_blocks_per_group  = struct.unpack("<I", data[32:36])[0]
-        p_s_frags_per_group   = struct.unpack("<I", data[36:40])[0]
-        p_s_inodes_per_group  = struct.unpack("<I", data[40:44])[0]
-        #
-        p_s_mtime             = struct.unpack("<I", data[44:48])[0]
-        p_s_wtime             = struct.unpack("<I", data[48:52])[0]
-        p_s_mnt_count         = struct.unpack("<H", data[52:54])[0]
-        p_s_max_mnt_count     = struct.unpack("<H", data[54:56])[0]
-        p_s_magic             = struct.unpack("<H", data[56:58])[0]
-        p_s_state             = struct.unpack("<H", data[58:60])[0]
-        p_s_errors            = struct.unpack("<H", data[60:62])[0]
-        p_s_minor_rev_level   = struct.unpack("<H", data[62:64])[0]
-        p_s_lastcheck         = struct.unpack("<I", data[64:68])[0]
-        p_s_checkinterval     = struct.unpack("<I", data[68:72])[0]
-        p_s_creator_os        = struct.unpack("<I", data[72:76])[0]
-        p_s_rev_level         = struct.unpack("<I", data[76:80])[0]
-        p_s_def_resuid        = struct.unpack("<H", data[80:82])[0]
-        p_s_def_resgid        = struct.unpack("<H", data[82:84])[0]
-        #
-        p_s_first_ino         = struct.unpack("<I", data[84:88])[0]
-        p_s_inode_size        = struct.unpack("<H", data[88:90])[0]
-        p_s_block_group_nr    = struct.unpack("<H", data[90:92])[0]
-        #
-        p_s_feature_compat    = struct.unpack("<I", data[92:96])[0]
-        p_s_feature_incompat  = struct.unpack("<I", data[96:100])[0]
-        p_s_feature_ro_compat = struct.unpack("<I", data[100:104])[0]
-        p_s_uuid              = struct.unpack("<BBBBBBBBBBBBBBBB", data[104:120])
-        p_s_volume_name       = data[120:136] # Volume name
-        p_s_last_mounted      = data[136:200] # Pathname of last mount point
-        p_s_algorithm_usage_bitmap = struct.unpack("<I", data[200:204])[0]
-        p_s_prealloc_blocks        = struct.unpack("<B", data[204:205])[0]
-        p_s_prealloc_dir_blocks    = struct.unpack("<B", data[205:206])[0]
-        #
-        p_s_padding1          = struct.unpack("<H", data[206:208])[0]
-        p_s_reserved          = data[208:1024]
+        # on the disk in little endian format (<), and we unpack them all at once (see _SB_STRUCT)
+        (p_s_inodes_count, p_s_blocks_count, p_s_r_blocks_count,
+         p_s_free_blocks_count, p_s_free_inodes_count, p_s_first_data_block,
+         p_s_log_block_size, p_s_log_frag_size, p_s_blocks_per_group,
+         p_s_frags_per_group, p_s_inodes_per_group,
+         #
+         p_s_mtime, p_s_wtime, p_s_mnt_count, p_s_max_mnt_count, p_s_magic,
+         p_s_state, p_s_errors, p_s_minor_rev_level, p_s_lastcheck,
+         p_s_checkinterval, p_s_creator_os, p_s_rev_level,
+         p_s_def_resuid, p_s_def_resgid,
+         #
+         p_s_first_ino, p_s_inode_size, p_s_block_group_nr,
+         #
+         p_s_feature_compat, p_s_feature_incompat, p_s_feature_ro_compat,
+         p_s_uuid,             # 16 bytes (a UUID)
+         p_s_volume_name,      # Volume name
+         p_s_last_mounted,     # Pathname of last mount point
+         p_s_algorithm_usage_bitmap, p_s_prealloc_blocks, p_s_prealloc_dir_blocks,
+         #
+         p_s_padding1) = _SB_STRUCT.unpack_from(data, 0)
+        # (the 816 bytes of padding are almost never looked at, so instead of copying them
+        #  we keep a view into the buffer, which we keep anyway in 'raw_data')
+        p_s_reserved = memoryview(data)[_SB_STRUCT.size:1024]
         # for ext3 there are some more fields: https://www.nongnu.org/ext2-doc/ext2.html#superblock
 
         self._raw_data = data # the raw read from the disk (the 1024 bytes of the superblock).
 
-        self.s_inodes_count      = s_inodes_count      or p_s_inodes_count
-        self.s_blocks_count      = s_blocks_count      or p_s_blocks_count
-        self.s_r_blocks_count    = s_r_blocks_count    or p_s_r_blocks_count
-        self.s_free_blocks_count = s_free_blocks_count or p_s_free_blocks_count
-        self.s_free_inodes_count = s_free_inodes_count or p_s_free_inodes_count
-        self.s_first_data_block  = s_first_data_block  or p_s_first_data_block
-        self.s_log_block_size    = s_log_block_size    or p_s_log_block_size
-        self.s_log_frag_size     = s_log_frag_size     or p_s_log_frag_size
-        self.s_blocks_per_group  = s_blocks_per_group  or p_s_blocks_per_group
-        self.s_frags_per_group   = s_frags_per_group   or p_s_frags_per_group
-        self.s_inodes_per_group  = s_inodes_per_group  or p_s_inodes_per_group
+        # The values passed as arguments (if any) take the place of the parsed ones ('is None', so that a 0 can be passed too).
+        # (the parsed values are already ints, only the arguments are converted: for the fields whose setter
+        #  only does that conversion, like 's_state' or 's_errors', we also skip the setter and assign the backing attribute)
+        self.s_inodes_count      = p_s_inodes_count      if s_inodes_count      is None else int(s_inodes_count)
+        self.s_blocks_count      = p_s_blocks_count      if s_blocks_count      is None else int(s_blocks_count)
+        self.s_r_blocks_count    = p_s_r_blocks_count    if s_r_blocks_count    is None else int(s_r_blocks_count)
+        self.s_free_blocks_count = p_s_free_blocks_count if s_free_blocks_count is None else int(s_free_blocks_count)
+        self.s_free_inodes_count = p_s_free_inodes_count if s_free_inodes_count is None else int(s_free_inodes_count)
+        self.s_first_data_block  = p_s_first_data_block  if s_first_data_block  is None else int(s_first_data_block)
+        self.s_log_block_size    = p_s_log_block_size    if s_log_block_size    is None else s_log_block_size
+        self.s_log_frag_size     = p_s_log_frag_size     if s_log_frag_size     is None else s_log_frag_size
+        self.s_blocks_per_group  = p_s_blocks_per_group  if s_blocks_per_group  is None else int(s_blocks_per_group)
+        self.s_frags_per_group   = p_s_frags_per_group   if s_frags_per_group   is None else int(s_frags_per_group)
+        self.s_inodes_per_group  = p_s_inodes_per_group  if s_inodes_per_group  is None else int(s_inodes_per_group)
         #
-        self.s_mtime             = s_mtime             or p_s_mtime
-        self.s_wtime             = s_wtime             or p_s_wtime
-        self.s_mnt_count         = s_mnt_count         or p_s_mnt_count
-        self.s_max_mnt_count     = s_max_mnt_count     or p_s_max_mnt_count
-        self.s_magic             = s_magic             or p_s_magic
-        self.s_state             = s_state             or p_s_state
-        self.s_errors            = s_errors            or p_s_errors
-        self.s_minor_rev_level   = s_minor_rev_level   or p_s_minor_rev_level
-        self.s_lastcheck         = s_lastcheck         or p_s_lastcheck
-        self.s_checkinterval     = s_checkinterval     or p_s_checkinterval
-        self.s_creator_os        = s_creator_os        or p_s_creator_os
-        self.s_rev_level         = s_rev_level         or p_s_rev_level
-        self.s_def_resuid        = s_def_resuid        or p_s_def_resuid
-        self.s_def_resgid        = s_def_resgid        or p_s_def_resgid
+        self.s_mtime             = p_s_mtime             if s_mtime             is None else s_mtime
+        self.s_wtime             = p_s_wtime             if s_wtime             is None else s_wtime
+        self.s_mnt_count         = p_s_mnt_count         if s_mnt_count         is None else int(s_mnt_count)
+        self.s_max_mnt_count     = p_s_max_mnt_count     if s_max_mnt_count     is None else int(s_max_mnt_count)
+        self.s_magic             = p_s_magic             if s_magic             is None else int(s_magic)
+        self._s_state            = p_s_state             if s_state             is None else int(s_state)
+        self._s_errors           = p_s_errors            if s_errors            is None else int(s_errors)
+        self.s_minor_rev_level   = p_s_minor_rev_level   if s_minor_rev_level   is None else int(s_minor_rev_level)
+        self.s_lastcheck         = p_s_lastcheck         if s_lastcheck         is None else s_lastcheck
+        self.s_checkinterval     = p_s_checkinterval     if s_checkinterval     is None else s_checkinterval
+        self._s_creator_os       = p_s_creator_os        if s_creator_os        is None else int(s_creator_os)
+        self.s_rev_level         = p_s_rev_level         if s_rev_level         is None else int(s_rev_level)
+        self.s_def_resuid        = p_s_def_resuid        if s_def_resuid        is None else int(s_def_resuid)
+        self.s_def_resgid        = p_s_def_resgid        if s_def_resgid        is None else int(s_def_resgid)
         #
-        self.s_first_ino         = s_first_ino         or p_s_first_ino
-        self.s_inode_size        = s_inode_size        or p_s_inode_size
-        self.s_block_group_nr    = s_block_group_nr    or p_s_block_group_nr
+        self.s_first_ino         = p_s_first_ino         if s_first_ino         is None else int(s_first_ino)
+        self.s_inode_size        = p_s_inode_size        if s_inode_size        is None else int(s_inode_size)
+        self.s_block_group_nr    = p_s_block_group_nr    if s_block_group_nr    is None else int(s_block_group_nr)
         #
-        self.s_feature_compat         = s_feature_compat         or p_s_feature_compat
-        self.s_feature_incompat       = s_feature_incompat       or p_s_feature_incompat
-        self.s_feature_ro_compat      = s_feature_ro_compat      or p_s_feature_ro_compat
-        self.s_uuid                   = s_uuid                   or p_s_uuid
-        self.s_volume_name            = s_volume_name            or p_s_volume_name
-        self.s_last_mounted           = s_last_mounted           or p_s_last_mounted
-        self.s_algorithm_usage_bitmap = s_algorithm_usage_bitmap or p_s_algorithm_usage_bitmap
-        self.s_prealloc_blocks        = s_prealloc_blocks        or p_s_prealloc_blocks
-        self.s_prealloc_dir_blocks    = s_prealloc_dir_blocks    or p_s_prealloc_dir_blocks
+        self.s_feature_compat         = p_s_feature_compat         if s_feature_compat         is None else s_feature_compat
+        self.s_feature_incompat       = p_s_feature_incompat       if s_feature_incompat       is None else s_feature_incompat
+        self.s_feature_ro_compat      = p_s_feature_ro_compat      if s_feature_ro_compat      is None else s_feature_ro_compat
+        self.s_uuid                   = p_s_uuid                   if s_uuid                   is None else s_uuid
+        self.s_volume_name            = p_s_volume_name            if s_volume_name            is None else s_volume_name
+        self.s_last_mounted           = p_s_last_mounted           if s_last_mounted           is None else s_last_mounted
+        self.s_algorithm_usage_bitmap = p_s_algorithm_usage_bitmap if s_algorithm_usage_bitmap is None else s_algorithm_usage_bitmap
+        self.s_prealloc_blocks        = p_s_prealloc_blocks        if s_prealloc_blocks        is None else int(s_prealloc_blocks)
+        self.s_prealloc_dir_blocks    = p_s_prealloc_dir_blocks    if s_prealloc_dir_blocks    is None else int(s_prealloc_dir_blocks)
         #
-        self.s_padding1 = s_padding1 or p_s_padding1
-        self.s_reserved = s_reserved or p_s_reserved
+        self.s_padding1 = p_s_padding1 if s_padding1 is None else s_padding1
+        self.s_reserved = p_s_reserved if s_reserved is None else s_reserved
 
         # 's_': superblock ; 'p_': parsed
 
@@ -152,76 +253,6 @@ class Superblock:
 
     # ---
 
-    @property
-    def s_inodes_count(self):
-        """Total number of inodes"""
-        return self._s_inodes_count
-
-    @s_inodes_count.setter
-    def s_inodes_count(self, value):
-        self._s_inodes_count = int(value)
-
-    @property
-    def s_blocks_count(self):
-        """Filesystem size in blocks"""
-        return self._s_blocks_count
-
-    @s_blocks_count.setter
-    def s_blocks_count(self, value):
-        self._s_blocks_count = int(value)
-
-    @property
-    def s_r_blocks_count(self):
-        """Number of reserved blocks"""
-        return self._s_r_blocks_count
-
-    @s_r_blocks_count.setter
-    def s_r_blocks_count(self, value):
-        self._s_r_blocks_count = int(value)
-
-    @property
-    def s_free_blocks_count(self):
-        """
-        Free blocks counter
-        (data blocks + directory-entry blocks)
-        """
-        return self._s_free_blocks_count
-
-    @s_free_blocks_count.setter
-    def s_free_blocks_count(self, value):
-        self._s_free_blocks_count = int(value)
-
-    @property
-    def s_free_inodes_count(self):
-        """
-        Free inodes counter
-        The inodes are each of the entries in the inode table, and this table
-        has a calculable size. Creating an inode does not mean that a new block
-        is allocated from the file system, but rather to fill in a new entry in the table.
-        Therefore, "s_free_inodes_count" is an independent calculation of "s_free_blocks_count".
-        """
-        return self._s_free_inodes_count
-
-    @s_free_inodes_count.setter
-    def s_free_inodes_count(self, value):
-        self._s_free_inodes_count = int(value)
-
-    @property
-    def s_first_data_block(self):
-        """
-        Number of first useful block.
-        It is the id of the block containing the superblock structure.
-
-        This value is always 0 for filesystems with a block size larger than 1KB,
-        and always 1 for filesystems with a block size of 1KB, since the superblock
-        is always starting at the 1024th byte of the disk's partition.
-        """
-        return self._s_first_data_block
-
-    @s_first_data_block.setter
-    def s_first_data_block(self, value):
-        self._s_first_data_block = int(value)
-
     @property
     def s_log_block_size(self):
         """
@@ -229,7 +260,7 @@ class Superblock:
         using 1,024 bytes as the unit. Thus, 0 denotes 1,024-byte blocks,
         1 denotes 2,048-byte blocks, and so on.
         """
-        size = 2**(10+self._s_log_block_size)
+        size = 1024 << self._s_log_block_size # (2**(10+s_log_block_size), without the pow call)
         return size
         
         # I think this would be fine, that is, if from 'outside' someone
@@ -269,86 +300,30 @@ class Superblock:
             value = -2
         self._s_log_frag_size = value
 
-    @property
-    def s_blocks_per_group(self):
-        """Number of blocks per group"""
-        return self._s_blocks_per_group
-
-    @s_blocks_per_group.setter
-    def s_blocks_per_group(self, value):
-        self._s_blocks_per_group = int(value)
-
-    @property
-    def s_frags_per_group(self):
-        """Number of fragments per group"""
-        return self._s_frags_per_group
-
-    @s_frags_per_group.setter
-    def s_frags_per_group(self, value):
-        self._s_frags_per_group = int(value)
-
-    @property
-    def s_inodes_per_group(self):
-        """Number of inodes per group"""
-        return self._s_inodes_per_group
-
-    @s_inodes_per_group.setter
-    def s_inodes_per_group(self, value):
-        self._s_inodes_per_group = int(value)
-
     # ---
 
     @property
     def s_mtime(self):
         """Time of last mount operation [POSIX time]"""
-        ts = self._s_mtime if self._s_mtime.timestamp() > 0. else None
+        # I will use DateTime objects for timestamps (this is explained in 'inode.py'),
+        # but, as in the inode, they are built here, only when someone asks for them.
+        ts = datetime.datetime.fromtimestamp(self._s_mtime, tz=datetime.timezone.utc) if self._s_mtime > 0 else None
         return ts
 
     @s_mtime.setter
     def s_mtime(self, value):
-        # I will use DateTime objects for timestamps (this is explained in 'inode.py')
-        self._s_mtime = datetime.datetime.fromtimestamp(value, tz=datetime.timezone.utc)
+        self._s_mtime = value # seconds elapsed since Unix epoch
 
     @property
     def s_wtime(self):
         """Time of last write operation [POSIX time]"""
-        ts = self._s_wtime if self._s_wtime.timestamp() > 0. else None
+        ts = datetime.datetime.fromtimestamp(self._s_wtime, tz=datetime.timezone.utc) if self._s_wtime > 0 else None
         return ts
 
     @s_wtime.setter
     def s_wtime(self, value):
-        self._s_wtime = datetime.datetime.fromtimestamp(value, tz=datetime.timezone.utc)
-
-    @property
-    def s_mnt_count(self):
-        """Mount operations counter"""
-        return self._s_mnt_count
-
-    @s_mnt_count.setter
-    def s_mnt_count(self, value):
-        self._s_mnt_count = int(value)
-
-    @property
-    def s_max_mnt_count(self):
-        """Number of mount operations before check"""
-        return self._s_max_mnt_count
-
-    @s_max_mnt_count.setter
-    def s_max_mnt_count(self, value):
-        self._s_max_mnt_count = int(value)
-
-    @property
-    def s_magic(self):
-        """
-        Magic signature (fixed to 0xEF53)
-        16bit value identifying the file system as Ext2.
-        """
-        return hex(self._s_magic)
+        self._s_wtime = value
 
-    @s_magic.setter
-    def s_magic(self, value):
-        self._s_magic = int(value)
-    
     @property
     def s_state(self):
         """
@@ -358,16 +333,7 @@ class Superblock:
 
         I return a string representing the status.
         """
-        status = "unknown"
-
-        if self._s_state == 0:
-            status = "the filesystem is mounted or was not cleanly unmounted"
-        elif self._s_state == 1:
-            status = "the filesystem was cleanly unmounted"
-        elif self._s_state == 2:
-            status = "the filesystem contains errors"
-
-        return status
+        return filesystem_states.get(self._s_state, "unknown")
 
     @s_state.setter
     def s_state(self, value):
@@ -376,181 +342,63 @@ class Superblock:
     @property
     def s_errors(self):
         """Behavior of the filesystem driver when detecting errors"""
-        behavior = "undefined"
-
-        if self._s_errors == 1:
-            behavior = "continue as if nothing happened"
-        elif self._s_errors == 2:
-            behavior = "remount read-only"
-        elif self._s_errors == 3:
-            behavior = "cause a kernel panic"
-
-        return behavior
+        return error_behaviors.get(self._s_errors, "undefined")
 
     @s_errors.setter
     def s_errors(self, value):
         self._s_errors = int(value)
 
-    @property
-    def s_minor_rev_level(self):
-        """Minor revision level"""
-        return self._s_minor_rev_level
-
-    @s_minor_rev_level.setter
-    def s_minor_rev_level(self, value):
-        self._s_minor_rev_level = int(value)
-
     @property
     def s_lastcheck(self):
         """Time of last check [POSIX time]"""
-        ts = self._s_lastcheck if self._s_lastcheck.timestamp() > 0. else None
+        ts = datetime.datetime.fromtimestamp(self._s_lastcheck, tz=datetime.timezone.utc) if self._s_lastcheck > 0 else None
         return ts
     
     @s_lastcheck.setter
     def s_lastcheck(self, value):
-        self._s_lastcheck = datetime.datetime.fromtimestamp(value, tz=datetime.timezone.utc)
+        self._s_lastcheck = value
 
     @property
     def s_checkinterval(self):
         """Time between checks [POSIX time]"""
-        # https://docs.python.org/3/library/datetime.html#datetime.timedelta.total_seconds
-        interval = self._s_checkinterval if self._s_checkinterval.total_seconds() > 0. else None
+        # https://docs.python.org/3/library/datetime.html#timedelta-objects
+        interval = datetime.timedelta(seconds=self._s_checkinterval) if self._s_checkinterval > 0 else None # a 'timedelta' object represents a duration
         return interval
 
     @s_checkinterval.setter
     def s_checkinterval(self, value):
-        # https://docs.python.org/3/library/datetime.html#timedelta-objects
-        self._s_checkinterval = datetime.timedelta(seconds=value) # a 'timedelta' object represents a duration
+        self._s_checkinterval = value # seconds
 
     @property
     def s_creator_os(self):
         """OS where filesystem was created"""
-        os = "unknown"
-
-        if self._s_creator_os == 0:
-            os = "Linux"
-        elif self._s_creator_os == 1:
-            os = "GNU HURD"
-        elif self._s_creator_os == 2:
-            os = "MASIX"
-        elif self._s_creator_os == 3:
-            os = "FreeBSD"
-        elif self._s_creator_os == 4:
-            os = "Lites"
-
-        return os
+        return creator_oses.get(self._s_creator_os, "unknown")
 
     @s_creator_os.setter
     def s_creator_os(self, value):
         self._s_creator_os = int(value)
 
-    @property
-    def s_rev_level(self):
-        """Revision level (0: revision 0 ; 1: revision 1)"""
-        return self._s_rev_level
-
-    @s_rev_level.setter
-    def s_rev_level(self, value):
-        self._s_rev_level = int(value)
-
-    @property
-    def s_def_resuid(self):
-        """Default User ID for reserved blocks (in Linux it is 0)"""
-        return self._s_def_resuid
-
-    @s_def_resuid.setter
-    def s_def_resuid(self, value):
-        self._s_def_resuid = int(value)
-
-    @property
-    def s_def_resgid(self):
-        """Default Group ID for reserved blocks (in Linux it is 0)"""
-        return self._s_def_resgid
-
-    @s_def_resgid.setter
-    def s_def_resgid(self, value):
-        self._s_def_resgid = int(value)
-
-    # ---
-
-    @property
-    def s_first_ino(self):
-        """
-        Number of first nonreserved inode
-
-        In revision 0, the first non-reserved inode is fixed to 11.
-        In revision 1 and later this value may be set to any value.
-        """
-        return self._s_first_ino
-
-    @s_first_ino.setter
-    def s_first_ino(self, value):
-        self._s_first_ino = int(value)
-
-    @property
-    def s_inode_size(self):
-        """
-        Size of on-disk inode structure
-
-        In revision 0, this value is always 128.
-        In revision 1 and later, this value must be a perfect power of 2
-        and must be smaller or equal to the block size.
-        """
-        return self._s_inode_size
-
-    @s_inode_size.setter
-    def s_inode_size(self, value):
-        self._s_inode_size = int(value)
-
-    @property
-    def s_block_group_nr(self):
-        """Block group number of this superblock (this can be used to rebuild
-        the file system from any superblock backup)"""
-        return self._s_block_group_nr
-
-    @s_block_group_nr.setter
-    def s_block_group_nr(self, value):
-        self._s_block_group_nr = int(value)
-
     # ---
     
-    @property
-    def s_feature_compat(self):
-        """Compatible features bitmap"""
-        return self._s_feature_compat
-
-    @s_feature_compat.setter
-    def s_feature_compat(self, value):
-        self._s_feature_compat = value
-
-    @property
-    def s_feature_incompat(self):
-        """Incompatible features bitmap"""
-        return self._s_feature_incompat
-
-    @s_feature_incompat.setter
-    def s_feature_incompat(self, value):
-        self._s_feature_incompat = value
-
-    @property
-    def s_feature_ro_compat(self):
-        """Read-only compatible features bitmap"""
-        return self._s_feature_ro_compat
-
-    @s_feature_ro_compat.setter
-    def s_feature_ro_compat(self, value):
-        self._s_feature_ro_compat = value
-
     @property
     def s_uuid(self):
-        """128-bit filesystem identifier"""
-        f_id = str(self._s_uuid).replace(", ", "-")
-        return f_id
+        """
+        128-bit filesystem identifier
+        (it's a UUID, so I return it in its usual 8-4-4-4-12 hex form, like 'blkid' and 'dumpe2fs' do)
+        """
+        # (formatting it is the most expensive part of __str__, so it's done once and kept, the setter resets it)
+        if self._s_uuid_str is None:
+            self._s_uuid_str = str(uuid.UUID(bytes=self._s_uuid))
+        return self._s_uuid_str
 
     @s_uuid.setter
     def s_uuid(self, value):
-        # I'm not sure if the ID is divided into 16 bytes, or is it directly a 16-byte number.
-        self._s_uuid = tuple(value)
+        # I admit the UUID as a string, or as its 16 bytes (bytes or any iterable of ints),
+        # but internally I keep the 16 bytes as they are on the disk.
+        if isinstance(value, str):
+            value = uuid.UUID(value).bytes
+        self._s_uuid = bytes(value)
+        self._s_uuid_str = None
 
     @property
     def s_volume_name(self):
@@ -563,6 +411,7 @@ class Superblock:
         if isinstance(value, str):
             value = bytes(value, ENCODING)
         self._s_volume_name = value.rstrip(b'\x00') # to remove trailing null chars
+        self._s_volume_name_str = self._s_volume_name.decode(ENCODING) # (decoded only once, for __str__)
 
     @property
     def s_last_mounted(self):
@@ -575,53 +424,7 @@ class Superblock:
         if isinstance(value, str):
             value = bytes(value, ENCODING)
         self._s_last_mounted = value.rstrip(b'\x00') # to remove trailing null chars
-
-    @property
-    def s_algorithm_usage_bitmap(self):
-        """Used for compression"""
-        return self._s_algorithm_usage_bitmap
-
-    @s_algorithm_usage_bitmap.setter
-    def s_algorithm_usage_bitmap(self, value):
-        self._s_algorithm_usage_bitmap = value
-
-    @property
-    def s_prealloc_blocks(self):
-        """Number of blocks to preallocate for regular files"""
-        return self._s_prealloc_blocks
-
-    @s_prealloc_blocks.setter
-    def s_prealloc_blocks(self, value):
-        self._s_prealloc_blocks = int(value)
-
-    @property
-    def s_prealloc_dir_blocks(self):
-        """Number of blocks to preallocate for directories"""
-        return self._s_prealloc_dir_blocks
-
-    @s_prealloc_dir_blocks.setter
-    def s_prealloc_dir_blocks(self, value):
-        self._s_prealloc_dir_blocks = int(value)
-
-    # ---
-
-    @property
-    def s_padding1(self):
-        """Alignment to word [2 bytes]"""
-        return self._s_padding1
-
-    @s_padding1.setter
-    def s_padding1(self, value):
-        self._s_padding1 = value
-
-    @property
-    def s_reserved(self):
-        """Nulls to pad out 1,024 bytes [816 bytes]"""
-        return self._s_reserved
-
-    @s_reserved.setter
-    def s_reserved(self, value):
-        self._s_reserved = value
+        self._s_last_mounted_str = self._s_last_mounted.decode(ENCODING) # (decoded only once, for __str__)
 
 
     # I do not show all the fields, only the ones that I found most interesting.
@@ -641,7 +444,7 @@ class Superblock:
                 f"Time of last mount operation:                    {self.s_mtime or 'Not defined'}\n"
                 f"Time of last write operation:                    {self.s_wtime or 'Not defined'}\n"
                 f"Mount operations counter:                        {self.s_mnt_count}\n"
-                f"Magic signature:                                 {self.s_magic}\n"
+                f"Magic signature:                                 {self.s_magic:#06x}\n"
                 f"Status flag:                                     {self.s_state}\n"
                 f"Time of last check:                              {self.s_lastcheck or 'Not defined'}\n"
                 f"Time between checks:                             {self.s_checkinterval or 'Not defined'}\n"
@@ -651,8 +454,8 @@ class Superblock:
                 f"Size of on-disk inode structure:                 {self.s_inode_size}\n"
                 f"Block group number of this superblock:           {self.s_block_group_nr}\n"
                 f"Filesystem identifier:                           {self.s_uuid}\n"
-                f"Volume name:                                     {self.s_volume_name.decode(ENCODING)}\n"
-                f"Pathname of last mount point:                    {self.s_last_mounted.decode(ENCODING)}\n"
+                f"Volume name:                                     {self._s_volume_name_str}\n"
+                f"Pathname of last mount point:                    {self._s_last_mounted_str}\n"
                 f"Number of blocks to preallocate:                 {self.s_prealloc_blocks}\n"
                 f"Number of blocks to preallocate for directories: {self.s_prealloc_dir_blocks}\n"
             )
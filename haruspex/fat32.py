@@ -5,12 +5,11 @@ import calendar
 import datetime
 import struct
 import sys
+from array import array
+from collections import OrderedDict
 from time import time
 
 
-from .utils import slicer
-
-
 # TODO: read https://stackoverflow.com/questions/13775893/converting-struct-to-byte-and-back-to-struct
 #       and research a bit into this being a reasonable way to convert bytes
 #       into structs (and back).
@@ -28,21 +27,38 @@ ATTRIBUTES = {
     "archive"  : 0x20,
 }
 
-# TODO: this is actually a hack right now, and there might be a simpler way to
-#       do it
-ALL_ASCII = b"".maketrans(b"", b"")  # a bit hacky, but works
 FILENAME_CHARS = b"0123456789 ABCDEFGHIJKLMNOPQRSTUVWXYZ!#$%&'()-@^_`{}~\xe5"
-REMAIN_ASCII = ALL_ASCII
-for idx, char in enumerate(FILENAME_CHARS):
-    char = FILENAME_CHARS[idx:idx + 1]
-    REMAIN_ASCII = REMAIN_ASCII.replace(char, b"")
-FILENAME_TRANS = b"".maketrans(
-    REMAIN_ASCII,
-    b"\x00" * len(REMAIN_ASCII)
+# FileRecord's name/ext setters use this table to uppercase and blank (to
+# \x00) the chars not in FILENAME_CHARS, in a single bytes.translate pass
+# (translate's delete argument would save us the .replace() afterwards, but
+# it's quite a bit slower)
+_NAME_TABLE = bytes(
+    c if c in FILENAME_CHARS else 0 for c in bytes(range(256)).upper()
 )
 # TODO: the whole PATH_SEP thing might need better thought, but for the moment
 #       simple should be enough
 PATH_SEP = "\\"
+# Maximum number of parsed directories kept by FAT32.open (see FAT32._dir_cache)
+DIRECTORY_CACHE_SIZE = 128
+
+# The formats are compiled once here, instead of handing the format string to
+# struct.unpack on every call (and we unpack straight from the buffers, no
+# slicing). A directory entry/file record is 32 bytes:
+#   name (8), ext (3), attributes, flags, creation time 10ms-units,
+#   creation time, creation date, last access date, cluster (high word),
+#   modified time, modified date, cluster (low word), size
+_RECORD_STRUCT = struct.Struct("<8s3sBBBHHHHHHHL")
+_TIME_STRUCT   = struct.Struct("<HH")  # time + date
+
+# FAT32 entries are really 28 bits, the top 4 are reserved and must be ignored
+# when following a chain, and anything from _EOC_MIN up marks its end
+_CLUSTER_MASK = 0x0FFFFFFF
+_EOC_MIN      = 0x0FFFFFF8
+
+# The parts of the boot sector we care about, unpacked from its start:
+#   bytes per sector (0x0b), sectors per cluster, reserved sectors, number of
+#   FATs, sectors per FAT (0x24), root cluster (0x2c)
+_BOOT_STRUCT = struct.Struct("<11xHBHB19xL4xL")
 
 
 def read_attributes(value):
@@ -85,7 +101,15 @@ def read_time(bytes_, mili=0):
         for timestamps that support it (defaults to 0)
     :return: datetime.datetime object
     """
-    raw_time, raw_date, = struct.unpack("<HH", bytes_)
+    raw_time, raw_date, = _TIME_STRUCT.unpack_from(bytes_)
+    return _decode_time(raw_time, raw_date, mili)
+
+def _decode_time(raw_time, raw_date, mili=0):
+    """
+    Does the actual work of `read_time`, on the already unpacked (int) time
+    and date fields, so that FileRecord can use it straight from its single
+    unpack.
+    """
     # first we take care of the date
     year    = (raw_date >> 9) + 1980
     month   = (raw_date & 0b0000000111100000) >> 5
@@ -96,6 +120,12 @@ def read_time(bytes_, mili=0):
     second  = (raw_time & 0b0000000000011111) * 2
     second += mili // 100
     micros  = (mili % 100) * 10000
+    # almost every timestamp on disk is a valid one, so we first try with the
+    # values as they are, and only check them when datetime doesn't like them
+    try:
+        return datetime.datetime(year, month, day, hour, minute, second, micros)
+    except ValueError:
+        pass
     # we know theres an issue in some Linux based systems that make
     # 0xffffffff datetimes for some FileRecords (that don't seem to belong to
     # the files, some kind of temporary record) so we must check a few things:
@@ -154,21 +184,50 @@ def write_time(dt, *, full=False, date_only=False):
     return extra + value
 
 
+def _cluster_runs(chain):
+    """
+    Splits a cluster chain into runs of consecutive clusters, so that each run
+    can be read from disk at once.
+
+    :param chain: sequence of cluster numbers, as returned by `FAT32._chain`
+    :return: generator of (first cluster, number of clusters) tuples
+    """
+    clusters = iter(chain)
+    start = prev = next(clusters, None)
+    if start is None:
+        return
+    for cluster in clusters:
+        if cluster != prev + 1:
+            yield start, prev - start + 1
+            start = cluster
+        prev = cluster
+    yield start, prev - start + 1
+
+
 class FileRecord:
     """
     An entry inside a FAT32 directory.
     """
+    # there's one of these per directory entry, so no __dict__ for them
+    __slots__ = (
+        "_raw_data", "_name", "_ext", "_size", "_attr_byte", "_attributes",
+        "_flags", "_cluster", "_created", "_last_access", "_modified",
+        "_raw_times",
+    )
+
     def __init__(self, data):
         self._raw_data   = data
         self._name       = b""
         self._ext        = b""
         self._size       = -1
-        self._attributes = {k: False for k in ATTRIBUTES}
+        self._attr_byte  = 0
+        self._attributes = None  # the dict is built on demand, from _attr_byte
         self._flags      = 0  # reserved, should be 0 but different implementations may use it 
         self._cluster    = -1
         self._created    = None
         self._last_access= None
         self._modified   = None
+        self._raw_times  = None  # the raw on-disk timestamp fields, see _load
         # that's all for real attributes of a file record
         self._parse()
     
@@ -199,15 +258,16 @@ class FileRecord:
     def name(self, value):
         if isinstance(value, str):
             value = bytes(value, "latin1")
-        value = value.upper()  # not supporting long names for the moment
-        name = value.translate(FILENAME_TRANS)
-        name = name.replace(b"\x00", b"")
-        name = name[0:8]   # byebye long names!
         # let's check if there's an ext, for the lazy user
         if b"." in value:
-            name, dot, ext = value.rpartition(b".")
+            name, dot, ext = value.upper().rpartition(b".")
             ext = ext.rstrip()
             self._ext = ext[-3:]
+        else:
+            # not supporting long names for the moment
+            name = value.translate(_NAME_TABLE)
+            name = name.replace(b"\x00", b"")
+            name = name[0:8]   # byebye long names!
         name = name.rstrip()
         self._name = name # 
         # will not enforce name uniqueness, just being uppercase and within
@@ -227,8 +287,7 @@ class FileRecord:
     def ext(self, value):
         if isinstance(value, str):
             value = bytes(value, "latin1")
-        value = value.upper()
-        ext = value.translate(FILENAME_TRANS)
+        ext = value.translate(_NAME_TABLE)
         ext = ext.replace(b"\x00", b"")
         ext = ext.rstrip()
         ext = ext[0:3]
@@ -240,7 +299,7 @@ class FileRecord:
         Helper property, returns name for directories and name.ext for files.
         Read only.
         """
-        if self.attributes["directory"]:
+        if self._attr("directory"):
             return self.name
         return self.name + b"." + self.ext
     
@@ -273,13 +332,27 @@ class FileRecord:
         When setting this property, checks are made to make sure it can be
         represented as the packed structure on disk.
         """
+        # most records never get their attributes dict looked at, so we keep
+        # the raw byte around and only build the dict the first time it's
+        # asked for (from then on, the dict is the one that counts)
+        if self._attributes is None:
+            self._attributes = read_attributes(self._attr_byte)
         return self._attributes
     
     @attributes.setter
     def attributes(self, value):
         # let's cleanup in case the given dict has some extra keys
         value = {k:v for k, v in value.items() if k in ATTRIBUTES}
-        self._attributes.update(value)
+        self.attributes.update(value)
+    
+    def _attr(self, key):
+        """
+        Checks a single attribute (by its `ATTRIBUTES` name) without building
+        the attributes dict, if nobody needed it so far.
+        """
+        if self._attributes is None:
+            return bool(self._attr_byte & ATTRIBUTES[key])
+        return self._attributes[key]
     
     @property
     def flags(self):
@@ -329,6 +402,9 @@ class FileRecord:
         * Microsecond accuracy of the datetime object is capped to 10ms
           resolution (as can be represented in structure)
         """
+        if self._created is None:
+            ctime_ms, ctime, cdate = self._raw_times[:3]
+            self.created = _decode_time(ctime, cdate, mili=ctime_ms)
         return self._created
     
     @created.setter
@@ -364,6 +440,9 @@ class FileRecord:
         It is technically a datetime still to be consistent with the other
         timestamps.
         """
+        if self._last_access is None:
+            adate = self._raw_times[3]
+            self.last_access = _decode_time(0, adate)
         return self._last_access
     
     @last_access.setter
@@ -396,6 +475,9 @@ class FileRecord:
         * The datetimes object second resolution is cut to 2 second icnrementes
           (as the on-disk structure allows) and microseconds are set to 0.
         """
+        if self._modified is None:
+            mtime, mdate = self._raw_times[4:]
+            self.modified = _decode_time(mtime, mdate)
         return self._modified
     
     @modified.setter
@@ -437,7 +519,7 @@ class FileRecord:
     def __repr__(self):
         name = self.name.decode("latin1")
         ext  = self.ext.decode("latin1")
-        if self.attributes["directory"]:
+        if self._attr("directory"):
             showname = f"<DIR> {name}"
         else:
             showname = f"{name}.{ext}"
@@ -446,7 +528,7 @@ class FileRecord:
     def __str__(self):
         name = self.name.decode("latin1")
         ext  = self.ext.decode("latin1")
-        if self.attributes["directory"]:
+        if self._attr("directory"):
             showname = f"<DIR> {name}"
         else:
             showname = f"{name}.{ext}"
@@ -468,7 +550,7 @@ class FileRecord:
         """
         ret = [
             k[0].upper() if v else k[0]
-            for (k, v) in self._attributes.items()
+            for (k, v) in self.attributes.items()
         ]
         return "".join(ret)
     
@@ -499,16 +581,53 @@ class FileRecord:
         """
         # TODO: maybe it should be called load? or just parse?
         #       will define it better after having a dump() or save() method
-        self.name        = self._raw_data[0:8] + b"." + self._raw_data[8:11]
+        self._load(_RECORD_STRUCT.unpack_from(self._raw_data))
+
+    def _load(self, fields):
+        """
+        Sets the properties of the file from the already unpacked fields of
+        the record (see `_RECORD_STRUCT`).
+        """
+        (name, ext, attrs, flags, ctime_ms, ctime, cdate, adate,
+         cluster_hi, mtime, mdate, cluster_lo, size) = fields
+        self.name        = name + b"." + ext
         # we use the shorthand that sets name and extension in a single pass
-        self.size,       = struct.unpack("<L", self._raw_data[28:32])
-        self.attributes  = read_attributes(self._raw_data[11])
-        self.flags       = self._raw_data[12]
-        self.cluster,    = struct.unpack("<L", self._raw_data[26:28] + self._raw_data[20:22])
-        self.created     = read_time(self._raw_data[14:18], mili=self._raw_data[13])
-        self.last_access = read_time(b"\x00\x00" + self._raw_data[18:20])
-        self.modified    = read_time(self._raw_data[22:26])
+        self.size        = size
+        self._attr_byte  = attrs
+        self._attributes = None  # (see the attributes property)
+        self.flags       = flags
+        self.cluster     = (cluster_hi << 16) | cluster_lo
+        # the timestamps are only decoded (and memoized) when somebody asks
+        # for them, most records never get their datetimes looked at
+        self._raw_times  = (ctime_ms, ctime, cdate, adate, mtime, mdate)
+        self._created    = None
+        self._last_access= None
+        self._modified   = None
 
+    @classmethod
+    def iter_records(cls, buf):
+        """
+        Generator that walks a whole directory buffer (`buf`, a multiple of 32
+        bytes), yielding a FileRecord for each entry in it. Empty entries (all
+        zeroes) and long file name (LFN) entries are skipped without building
+        an object for them.
+
+        All the entries are unpacked in a single pass (struct.iter_unpack),
+        and each FileRecord is loaded straight from its unpacked fields.
+        """
+        new   = cls.__new__
+        empty = bytes(32)
+        for offset, fields in zip(range(0, len(buf), 32), _RECORD_STRUCT.iter_unpack(buf)):
+            if fields[2] & 0x0f == 0x0f:
+                # LFN entry (read-only + hidden + system + volume-id)
+                continue
+            raw = buf[offset:offset + 32]
+            if raw == empty:
+                continue
+            record = new(cls)
+            record._raw_data = raw
+            record._load(fields)
+            yield record
 
 
 class Directory:
@@ -525,6 +644,11 @@ class Directory:
         path string
     :return: Directory object in `filesystem `for the given `record`
     """
+    __slots__ = (
+        "_filesystem", "_record", "cluster", "_parent", "files", "_by_name",
+        "path",
+    )
+
     def __init__(self, filesystem, record, *, parent=None):
         self._filesystem = filesystem
         if record is None:
@@ -535,6 +659,7 @@ class Directory:
         # a bit of a hack for the root cluster
         self._parent     = parent
         self.files       = []
+        self._by_name    = {}  # fullname -> FileRecord, for FAT32.open
         if parent is None:
             self.path = record.name.decode("latin1")
         else:
@@ -559,39 +684,38 @@ class Directory:
         skipped since we don't want to tread into Microsoft patents territory.
         Might think of supporting Linux-stlye LFNs.
         """
-        
-        def lfn_filter(record):
-            """
-            Returns false for records which are LFN data.
-            """
-            attrs = record.attributes
-            lfn = (
-                attrs["read-only"] and
-                attrs["hidden"] and
-                attrs["system"] and
-                attrs["volume-id"]
-            )
-            return not(lfn)
-
         filesystem   = self._filesystem
         record       = self._record
-        raw_data     = []
-        cluster      = self.cluster
-        next_cluster = filesystem.fat1[cluster]
-        while next_cluster <= 0x0ffffff0:
-            raw_data.append(filesystem._read_cluster(cluster))
-            cluster = next_cluster
-            next_cluster = filesystem.fat1[cluster]
-        raw_data.append(filesystem._read_cluster(cluster))
-        raw_data  = b"".join(raw_data)
-        self.files = list(filter(
-            lfn_filter,
-            (
-                FileRecord(s)
-                for s in slicer(raw_data, 32)
-                if s != bytes(32)
-            )
-        ))
+        # we get the whole chain first, and then read it a run of contiguous
+        # clusters at a time (a single read for an unfragmented directory),
+        # straight into one buffer
+        raw_data     = filesystem._read_chain(filesystem._chain(self.cluster))
+        raw_data     = bytes(raw_data)  # so the records' raw_data are bytes
+        # empty and LFN entries are skipped before building a FileRecord
+        self.files = list(FileRecord.iter_records(raw_data))
+        # and we index them by fullname, so that FAT32.open doesn't have to
+        # scan the list (setdefault keeps the first one if a name is repeated,
+        # same as the scan did)
+        by_name = {}
+        for f in self.files:
+            by_name.setdefault(f.fullname, f)
+        self._by_name = by_name
+
+    def _copy(self, record, parent):
+        """
+        Returns a new Directory for `record` (inside `parent`) with the entries
+        already parsed in this one, without reading anything (see FAT32.open).
+        The `files` list is its own, but the FileRecords in it are shared.
+        """
+        new = Directory.__new__(Directory)
+        new._filesystem = self._filesystem
+        new._record     = record
+        new.cluster     = record.cluster
+        new._parent     = parent
+        new.files       = list(self.files)
+        new._by_name    = self._by_name
+        new.path        = parent.path + PATH_SEP + record.name.decode("latin1")
+        return new
 
 class FileHandle:
     """
@@ -600,6 +724,12 @@ class FileHandle:
     object, because it actually deals with the filesystem on a level closer to
     the OS.
     """
+    __slots__ = (
+        "_filesystem", "_record", "_mode", "path", "closed", "_buffer",
+        "_buffer_pos", "_buffer_size", "_chain", "_cindex", "_file_pos",
+        "_readable",
+    )
+
     def __init__(self, filesystem, record, mode="rb", *, parent=None):
         self._filesystem = filesystem
         self._record     = record
@@ -617,9 +747,12 @@ class FileHandle:
         self._buffer_pos  = 0  # for easier handling of the buffer and _file_pos
         self._buffer_size = filesystem.sectors_per_cluster * filesystem.bytes_per_sector
             # we buffer a cluster at a time
-        self._ccluster    = record.cluster
-        # we keep track of which cluster we're own to read the next one when
-        # necessary
+        self._chain       = filesystem._chain(record.cluster)
+        # we keep the whole chain of the file, so that read and seek don't
+        # have to walk the FAT
+        self._cindex      = 0
+        # and track which cluster of the chain we're own (the buffered one) to
+        # read the next ones when necessary
         self._file_pos    = 0  # position in the file, .tell() returns this
         self._readable    = True  # will set along with mode, when supported
     
@@ -653,27 +786,38 @@ class FileHandle:
     def read(self, size=-1):
         bsize = self._buffer_size
         start = self._buffer_pos
-        if size < 0:
-            size = self._record.size - self._file_pos
-        ret = []
-        # and now we read
-        while (bsize - start) < size:  # we have to read clusters from the chain
-            ret.append(self._buffer[start:])
-            size -= (bsize - start)
-            self._file_pos += (bsize - start)
-            ncluster = self._filesystem.fat1[self._ccluster]
-            if ncluster >= 0x0ffffff0:
-                # magic EOF cluster number, found by trial and error
-                # TODO: check that the cluster is within bounds of the fs
-                break
-            start = 0
-            self._ccluster = ncluster
-            self._buffer = bytearray(self._filesystem._read_cluster(ncluster))
-        span = min(self._record.size - self._file_pos, size)
-        ret.append(self._buffer[start: start + span])
-        self._buffer_pos =  start + span
-        self._file_pos   += span
-        return b"".join(ret)
+        remaining = max(self._record.size - self._file_pos, 0)
+        if size < 0 or size > remaining:
+            size = remaining  # we never read past the end of the file
+        if start + size <= bsize:  # it's all in the buffered cluster
+            ret = bytes(self._buffer[start:start + size])
+            self._buffer_pos += size
+            self._file_pos   += size
+            return ret
+        # otherwise we take what's left of the buffer, and read the clusters
+        # that follow in the chain straight into a single output buffer, a run
+        # of contiguous clusters at a time (so a sequential read of an
+        # unfragmented file is a single read)
+        head  = bsize - start
+        first = self._cindex + 1
+        count = -(-(size - head) // bsize)  # ceil
+        chain = self._chain[first:first + count]
+        out   = bytearray(head + len(chain) * bsize)
+        with memoryview(out) as view:
+            view[:head] = self._buffer[start:]
+            self._filesystem._readinto_chain(chain, view[head:])
+        if chain:
+            # the last cluster we read becomes the buffered one
+            self._cindex = first + len(chain) - 1
+            self._buffer = out[-bsize:]
+            self._buffer_pos = min(size - head - (len(chain) - 1) * bsize, bsize)
+        else:
+            # the chain is shorter than the file size says, nothing else to read
+            self._buffer_pos = bsize
+        del out[size:]  # the tail of the last cluster, past what was asked
+        ret = bytes(out)
+        self._file_pos += len(ret)
+        return ret
     
     def readable(self):
         """
@@ -696,22 +840,18 @@ class FileHandle:
         filesystem = self._filesystem
         record     = self._record
         bsize      = self._buffer_size
-        # it's not pretty but it's simple -- we'll have to do a scan of the
-        # FAT to see in which cluster we have to land, and buffer that
+        # we look up in the chain in which cluster we have to land (the last
+        # one if we go past the end), and buffer that
         # c_idx will be our cluster index
-        c_idx = offset // bsize
-        self._ccluster = record.cluster
-        ncluster = self._filesystem.fat1[self._ccluster]
-        while (ncluster < 0x0ffffff0) and c_idx > 0:
-            self._ccluster = ncluster
-            c_idx -= 1
-            ncluster = self._filesystem.fat1[self._ccluster]
+        chain = self._chain
+        c_idx = min(offset // bsize, len(chain) - 1)
+        self._cindex = c_idx
         if offset >= record.size:  # we went over the end of the file
-            self._buffer     = bytearray(filesystem._read_cluster(self._ccluster))
+            self._buffer     = bytearray(filesystem._read_cluster(chain[c_idx]))
             self._file_pos   = record.size
             self._buffer_pos = record.size % bsize
             return self._file_pos
-        self._buffer     = bytearray(filesystem._read_cluster(self._ccluster))
+        self._buffer     = bytearray(filesystem._read_cluster(chain[c_idx]))
         self._buffer_pos = offset % bsize
         self._file_pos   = offset
         return self._file_pos
@@ -754,8 +894,7 @@ class FAT32:
         self._handle.seek(base_address)
         # and now for the header data...}
         buffer = self._handle.read(512)
-        bps, spc, rs, nof = struct.unpack("<HBHB", buffer[0x0b:0x11])
-        spf, _, rc = struct.unpack("<LLL", buffer[0x24:0x30])
+        bps, spc, rs, nof, spf, rc = _BOOT_STRUCT.unpack_from(buffer)
         self.bytes_per_sector    = bps
         self.sectors_per_cluster = spc
         self.reserved_sectors    = rs
@@ -776,6 +915,11 @@ class FAT32:
         # I should probably set these to be read only through properties...
         self.fat1 = []
         self.fat2 = []
+        # the directories already parsed by open, by (parent cluster, cluster),
+        # so that it doesn't read and parse them again. It's LRU (a hit moves
+        # the entry to the end, and we drop from the beginning), and it never
+        # has to be invalidated, since we don't write to the filesystem
+        self._dir_cache = OrderedDict()
         self._load_fats()
         self._post_init()
     
@@ -805,13 +949,52 @@ class FAT32:
         spf = self.sectors_per_fat
         bps = self.bytes_per_sector
         self._handle.seek(self.fat1_address)
+        # the entries are loaded straight into arrays of uint32 (a single copy
+        # of the bytes, 4 bytes each), instead of a list of Python ints built
+        # from one tuple per entry
         raw_fat = self._handle.read(spf * bps)
-        self.fat1 = [ v[0] for v in struct.iter_unpack("<L", raw_fat) ]
+        self.fat1 = self._fat_array(raw_fat)
         # since we're literally where the second FAT starts, we can just read
         # from here on
         raw_fat = self._handle.read(spf * bps)
-        self.fat2 = [ v[0] for v in struct.iter_unpack("<L", raw_fat) ]
+        self.fat2 = self._fat_array(raw_fat)
+
+    @staticmethod
+    def _fat_array(raw_fat):
+        """
+        Loads the raw bytes of a FAT into an array of (little endian) uint32.
+        """
+        fat = array("I")
+        fat.frombytes(raw_fat)
+        if sys.byteorder == "big":
+            fat.byteswap()
+        return fat
     
+    def _chain(self, cluster):
+        """
+        Follows the cluster chain that starts at `cluster` through the FAT.
+
+        :param cluster: first cluster of the chain
+        :return: array (uint32) with all the cluster numbers of the chain, in
+            order
+        """
+        fat   = self.fat1
+        limit = len(fat)
+        chain = array("I", (cluster,))
+        if cluster >= limit:
+            return chain
+        next_cluster = fat[cluster] & _CLUSTER_MASK
+        # besides the EOC marks, we stop on anything that can't be a data
+        # cluster (free, reserved, bad or past the FAT) and we never take more
+        # clusters than the FAT has, so a corrupt FAT with a loop in it can't
+        # keep us here forever
+        while 2 <= next_cluster < limit and next_cluster < _EOC_MIN:
+            chain.append(next_cluster)
+            if len(chain) > limit:
+                break
+            next_cluster = fat[next_cluster] & _CLUSTER_MASK
+        return chain
+
     def _cluster_address(self, cluster):
         """
         Calculates `cluster` address in the file the filesystem is being read
@@ -847,6 +1030,39 @@ class FAT32:
         self._handle.seek(pos)
         return self._handle.read(length)
     
+    def _read_chain(self, chain):
+        """
+        Reads all the clusters in `chain` into a single buffer, preallocated
+        to the full size, with one readinto per run of contiguous clusters.
+
+        :param chain: sequence of cluster numbers (as returned by `_chain`)
+        :return: bytearray with the contents of the clusters, in chain order
+        """
+        csize = self.bytes_per_sector * self.sectors_per_cluster
+        buf   = bytearray(len(chain) * csize)
+        with memoryview(buf) as view:
+            self._readinto_chain(chain, view)
+        return buf
+    
+    def _readinto_chain(self, chain, view):
+        """
+        Reads all the clusters in `chain` into `view`, with one readinto per
+        run of contiguous clusters. If the image is truncated, whatever is
+        missing is left as it was in `view`.
+
+        :param chain: sequence of cluster numbers (as returned by `_chain`)
+        :param view: writable memoryview, at least as long as the clusters in
+            `chain`
+        """
+        csize  = self.bytes_per_sector * self.sectors_per_cluster
+        handle = self._handle
+        offset = 0
+        for cluster, nclusters in _cluster_runs(chain):
+            length = nclusters * csize
+            handle.seek(self._cluster_address(cluster))
+            handle.readinto(view[offset:offset + length])
+            offset += length
+    
     def _post_init(self):
         """
         Finishes setting up values in the filesystem. Everything that comes here
@@ -855,7 +1071,7 @@ class FAT32:
         """
         root = Directory(self, None)
         v_id = root.files[0]
-        if v_id.attributes["volume-id"]:
+        if v_id._attr("volume-id"):
             root.path = (v_id.name + v_id.ext).decode("ascii")
         self.root = root
     
@@ -863,6 +1079,11 @@ class FAT32:
         """
         Opens a file or directory found in the absolute path passed.
 
+        The directories along the way are parsed only the first time (see
+        `_dir_cache`). Every call still returns a new Directory object, with
+        its own `path` and `files` list, but the FileRecords in it are shared
+        with the other Directory objects for the same directory.
+
         :param path: absolute path to open.
         :returns: FileHandle or Directory object, depending on the path.
         """
@@ -872,23 +1093,27 @@ class FAT32:
         parts = path.split(b"/")[1:]
         # we ignore the first one, assuming it's the root -- remember, these
         # should be absolute paths!
-        obj = self.root
+        obj   = self.root
+        cache = self._dir_cache
         for part in parts:
-            try:
-                files = obj.files
-            except AttributeError:
+            if not isinstance(obj, Directory):
                 raise FileNotFoundError(f"{obj.path} is not a Directory!")
-            try:
-                idx = next( idx
-                            for idx, f in enumerate(files)
-                            if f.fullname == part
-                )
-            except StopIteration:
+            record = obj._by_name.get(part)
+            if record is None:
                 raise FileNotFoundError(f"No such file or directory {obj.path}\\{part}")
             # if we're here, we got a a directory
-            record = obj.files[idx]
-            if record.attributes["directory"]:
-                obj = Directory(self, record, parent=obj)
+            if record._attr("directory"):
+                key    = (obj.cluster, record.cluster)
+                parsed = cache.get(key)
+                if parsed is None:
+                    parsed = Directory(self, record, parent=obj)
+                    if len(cache) >= DIRECTORY_CACHE_SIZE:
+                        cache.popitem(last=False)  # the least recently used
+                    cache[key] = parsed
+                else:
+                    cache.move_to_end(key)
+                # the cached one is never handed out, the caller gets its own
+                obj = parsed._copy(record, parent=obj)
             else:
                 obj = FileHandle(self, record, parent=obj)
                 # hopefully this happens just once, otherwise 
@@ -40,6 +40,22 @@ print(file.read())
 print(file.tell())
 print(file.close())
 
+# a big sparse file, with holes in its direct, simple and double indirect blocks (made, for example, with
+# 'truncate -s 6M sparse_big.bin' and then writing a few pieces of it here and there, with 'dd ... seek=X conv=notrunc').
+# Its holes are not allocated on the disk, but they must read as zeros, in their place.
+sparse = fs.open("/dir1/sparse_big.bin")
+print(sparse.read(100))
+print(len(sparse.read(10000))) # (this goes through the holes that follow the first block)
+print(sparse.seek(5*1024*1024))
+print(sparse.read(16))
+print(sparse.close())
+
+# and a small one (it's read whole when it's opened), with a hole in between its two pieces of data
+sparse = fs.open("/dir1/sparse_small.bin")
+data = sparse.read()
+print(len(data), data[100:5000] == bytes(4900)) # the hole, in its place
+print(sparse.close())
+
 print("")
 print(fs.read_block(1)) # we show the raw content of block 1 of the filesystem
 print("")